@@ -6,6 +6,9 @@ from llm.common import call_json_chat
 from prompts import get as prompt_get, render as prompt_render
 
 
+_CRITIC_KEYS = ("clarity", "accuracy", "support", "hallucination_flag", "notes", "confidence")
+
+
 def _clamp(value: float, lower: float = 0.0, upper: float = 1.0) -> float:
     return max(lower, min(upper, value))
 
@@ -119,6 +122,14 @@ def score_with_critic(
         model_hint=model_hint,
     )
 
+    return _normalize_score(default_payload, result, prompt_set)
+
+
+def _normalize_score(
+    default_payload: Dict[str, Any],
+    result: Optional[Dict[str, Any]],
+    prompt_set: Optional[str],
+) -> Dict[str, Any]:
     # Ensure keys exist even if model omitted some
     merged = dict(default_payload)
     for key, value in (result or {}).items():
@@ -162,6 +173,11 @@ def _default_preference_payload(candidates: Sequence[Dict[str, Any]]) -> Dict[st
     }
 
 
+def _prior_ranking(scores: Sequence[float]) -> List[int]:
+    """Candidate indices by descending surrogate score; ties keep the lower index first."""
+    return sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+
+
 def preference_with_critic(
     observation: Dict[str, Any],
     candidates: Sequence[Dict[str, Any]],
@@ -214,6 +230,15 @@ def preference_with_critic(
         model_hint=model_hint,
     )
 
+    return _normalize_preference(default_payload, result, len(candidates), prompt_set)
+
+
+def _normalize_preference(
+    default_payload: Dict[str, Any],
+    result: Any,
+    num_candidates: int,
+    prompt_set: Optional[str],
+) -> Dict[str, Any]:
     merged = dict(default_payload)
     if isinstance(result, dict):
         merged.update(result)
@@ -223,10 +248,10 @@ def preference_with_critic(
         chosen_idx = int(chosen)
     except Exception:
         chosen_idx = 0
-    merged["chosen"] = max(0, min(chosen_idx, len(candidates) - 1))
+    merged["chosen"] = max(0, min(chosen_idx, num_candidates - 1))
 
     scores = merged.get("scores")
-    if not isinstance(scores, list) or len(scores) != len(candidates):
+    if not isinstance(scores, list) or len(scores) != num_candidates:
         scores = default_payload["scores"]
     merged["scores"] = [round(_clamp(float(val)), 4) for val in scores]
     merged["confidence"] = round(_clamp(float(merged.get("confidence", 0.6))), 4)
@@ -236,8 +261,120 @@ def preference_with_critic(
     return merged
 
 
+def batch_score_with_critic(
+    observation: Dict[str, Any],
+    candidates: Sequence[Dict[str, Any]],
+    *,
+    model_hint: Optional[str] = None,
+    prompt_set: Optional[str] = None,
+    max_tokens: int = 3000,
+) -> Dict[str, Any]:
+    """Score every candidate and pick the preferred one in a single judge call.
+
+    Each candidate needs ``response`` and may carry ``observation`` (defaults to
+    the shared one), ``response_metadata``, ``action`` and ``reward``. Returns
+    ``{"critics": [...], "preference": {...}}`` shaped like the outputs of
+    :func:`score_with_critic` and :func:`preference_with_critic`."""
+    if not candidates:
+        raise ValueError("candidates required")
+    template = prompt_get("tutor_rl.critic_batch")
+    if not template:
+        raise RuntimeError("missing prompt tutor_rl.critic_batch")
+
+    tutor_block = observation.get("tutor") or {}
+    classifier_block = observation.get("classifier") or {}
+
+    default_scores: List[Dict[str, Any]] = []
+    summaries: List[str] = []
+    for idx, candidate in enumerate(candidates):
+        cand_obs = candidate.get("observation") or observation
+        response_text = str(candidate.get("response", ""))
+        default_scores.append(
+            _heuristic_score(cand_obs, response_text, candidate.get("response_metadata") or {})
+        )
+        action = candidate.get("action") if isinstance(candidate.get("action"), dict) else (cand_obs.get("action") or {})
+        reward_total = candidate["reward"].get("total") if isinstance(candidate.get("reward"), dict) else None
+        summaries.append(
+            f"[{idx}] action={action.get('type') or 'n/a'} reward={reward_total}\n"
+            f"{response_text.strip() or '(empty response)'}"
+        )
+
+    default_preference = _default_preference_payload([
+        {"reward": candidate.get("reward"), "critic": default_scores[idx]}
+        for idx, candidate in enumerate(candidates)
+    ])
+
+    prompt_vars = {
+        "focus_concept": tutor_block.get("focus_concept") or tutor_block.get("inference_concept") or "",
+        "intent": classifier_block.get("intent") or "unknown",
+        "retrieved_context": _retrieved_context(observation),
+        "num_candidates": str(len(candidates)),
+        "candidate_responses": "\n\n".join(summaries),
+        "prior_ranking": " > ".join(str(idx) for idx in _prior_ranking(default_preference["scores"])),
+    }
+    prompt = prompt_render(template, prompt_vars)
+
+    default_payload = {
+        "candidates": [
+            dict(score, index=idx, score=default_preference["scores"][idx])
+            for idx, score in enumerate(default_scores)
+        ],
+        "chosen": default_preference["chosen"],
+        "confidence": default_preference["confidence"],
+        "reason": default_preference["reason"],
+    }
+    result = call_json_chat(
+        prompt,
+        default=default_payload,
+        max_tokens=max_tokens,
+        model_hint=model_hint,
+    )
+    result = result if isinstance(result, dict) else {}
+
+    # Distribute per-candidate judgements back by index; missing entries keep heuristics
+    judged: Dict[int, Dict[str, Any]] = {}
+    raw_candidates = result.get("candidates")
+    if isinstance(raw_candidates, list):
+        for pos, item in enumerate(raw_candidates):
+            if not isinstance(item, dict):
+                continue
+            try:
+                idx = int(item.get("index", pos))
+            except Exception:
+                continue
+            if 0 <= idx < len(candidates):
+                judged[idx] = item
+
+    critics = [
+        _normalize_score(
+            default_scores[idx],
+            {k: v for k, v in judged.get(idx, {}).items() if k in _CRITIC_KEYS},
+            prompt_set,
+        )
+        for idx in range(len(candidates))
+    ]
+
+    preference_result = {
+        key: result[key] for key in ("chosen", "confidence", "reason") if key in result
+    }
+    if judged:
+        preference_result["scores"] = [
+            judged[idx].get("score", default_preference["scores"][idx])
+            if idx in judged
+            else default_preference["scores"][idx]
+            for idx in range(len(candidates))
+        ]
+    try:
+        preference = _normalize_preference(default_preference, preference_result, len(candidates), prompt_set)
+    except (TypeError, ValueError):
+        preference = _normalize_preference(default_preference, None, len(candidates), prompt_set)
+
+    return {"critics": critics, "preference": preference}
+
+
 __all__ = [
     "score_with_critic",
     "preference_with_critic",
+    "batch_score_with_critic",
 ]
 
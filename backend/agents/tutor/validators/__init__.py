@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from config.tutor_rl import RewardWeights, ValidatorConfig, ValidatorThresholds
-from .aggregate import COMPONENT_ORDER, score_response
+from .aggregate import COMPONENT_ORDER, batch_score_response, score_response
 from .grounding import grounding_check
 from .intent import intent_alignment
 from .prereq import prereq_gate
@@ -16,6 +16,7 @@ __all__ = [
     "ValidatorThresholds",
     "COMPONENT_ORDER",
     "score_response",
+    "batch_score_response",
     "rubric_check",
     "stepwise_rubric_check",
     "intent_alignment",
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Sequence
 import os
 
 from config.tutor_rl import RewardWeights, ValidatorConfig
@@ -30,26 +30,20 @@ def _build_context(
     )
 
 
-def score_response(
-    observation: Dict[str, Any],
-    response_text: str,
-    response_metadata: Dict[str, Any] | None = None,
-    *,
-    weights: RewardWeights | None = None,
-    config: ValidatorConfig | None = None,
-) -> Dict[str, Any]:
-    config = config or ValidatorConfig.from_env()
-    weights = weights or RewardWeights.from_env()
-    response_metadata = response_metadata or {}
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "false").strip().lower() == "true"
 
-    context = _build_context(
-        observation=observation,
-        response_text=response_text,
-        response_metadata=response_metadata,
-    )
-
-    use_stepwise = os.getenv("TUTOR_STEPWISE_RUBRIC_ENABLED", "false").strip().lower() == "true"
 
+def _score_context(
+    context: ValidatorContext,
+    *,
+    weights: RewardWeights,
+    config: ValidatorConfig,
+    normalized_weights: Dict[str, float],
+    thresholds: Dict[str, float],
+    use_stepwise: bool,
+    export_steps: bool,
+) -> Dict[str, Any]:
     # Build component list in order; stepwise optional
     components: List[ValidatorComponentResult] = []
     if use_stepwise:
@@ -68,7 +62,6 @@ def score_response(
         ]
     )
 
-    normalized_weights = weights.normalized()
     components_payload: Dict[str, Dict[str, Any]] = {}
     aggregated_flags: List[str] = []
     total = 0.0
@@ -79,14 +72,13 @@ def score_response(
         weight = normalized_weights.get(component.name, 0.0)
         total += component.score * weight
 
-        threshold = config.thresholds.as_dict().get(component.name)
+        threshold = thresholds.get(component.name)
         if threshold is not None and component.score < threshold:
             aggregated_flags.append(f"{component.name}_below_threshold")
 
     total = _clamp(total)
 
     # Optionally export stepwise rubric step scores without affecting reward
-    export_steps = os.getenv("TUTOR_RL_EXPORT_STEP_SCORES", "false").strip().lower() == "true"
     if export_steps and not use_stepwise:
         try:
             sw_component = stepwise_rubric_check(context, config)
@@ -98,10 +90,71 @@ def score_response(
         "components": components_payload,
         "total": round(total, 4),
         "weights": weights.as_dict(),
-        "normalized_weights": normalized_weights,
+        "normalized_weights": dict(normalized_weights),
         "flags": aggregated_flags,
     }
 
 
-__all__ = ["score_response", "COMPONENT_ORDER"]
+def score_response(
+    observation: Dict[str, Any],
+    response_text: str,
+    response_metadata: Dict[str, Any] | None = None,
+    *,
+    weights: RewardWeights | None = None,
+    config: ValidatorConfig | None = None,
+) -> Dict[str, Any]:
+    return batch_score_response(
+        [observation],
+        [response_text],
+        [response_metadata],
+        weights=weights,
+        config=config,
+    )[0]
+
+
+def batch_score_response(
+    observations: Sequence[Dict[str, Any]],
+    responses: Sequence[str],
+    metadatas: Sequence[Dict[str, Any] | None] | None = None,
+    *,
+    weights: RewardWeights | None = None,
+    config: ValidatorConfig | None = None,
+) -> List[Dict[str, Any]]:
+    """Score several candidate responses, resolving config, weights and env flags once.
+
+    ``observations``, ``responses`` and ``metadatas`` are aligned by index; results
+    match :func:`score_response` called on each triple.
+    """
+    if len(observations) != len(responses):
+        raise ValueError("observations and responses must have the same length")
+    if metadatas is None:
+        metadatas = [None] * len(responses)
+    elif len(metadatas) != len(responses):
+        raise ValueError("metadatas and responses must have the same length")
+
+    config = config or ValidatorConfig.from_env()
+    weights = weights or RewardWeights.from_env()
+    shared = dict(
+        weights=weights,
+        config=config,
+        normalized_weights=weights.normalized(),
+        thresholds=config.thresholds.as_dict(),
+        use_stepwise=_env_flag("TUTOR_STEPWISE_RUBRIC_ENABLED"),
+        export_steps=_env_flag("TUTOR_RL_EXPORT_STEP_SCORES"),
+    )
+
+    return [
+        _score_context(
+            _build_context(
+                observation=observation,
+                response_text=response_text,
+                response_metadata=response_metadata or {},
+            ),
+            **shared,
+        )
+        for observation, response_text, response_metadata in zip(observations, responses, metadatas)
+    ]
+
+
+__all__ = ["score_response", "batch_score_response", "COMPONENT_ORDER"]
 
@@ -127,6 +127,11 @@ CREATE INDEX IF NOT EXISTS idx_chunk_heading_tsv ON chunk USING GIN (heading_tsv
 """,
         """
 CREATE INDEX IF NOT EXISTS idx_chunk_tags ON chunk USING GIN (tags);
+""",
+        """
+CREATE INDEX IF NOT EXISTS idx_chunk_pedagogy_role
+  ON chunk ((tags->>'pedagogy_role'))
+  WHERE tags->>'pedagogy_role' IS NOT NULL;
 """,
         """
 CREATE TABLE IF NOT EXISTS user_concept_mastery (
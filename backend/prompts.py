@@ -171,6 +171,38 @@ def _default_prompts() -> Dict[str, Any]:
                 "}\n"
                 "END_STRICT_JSON"
             ),
+            "critic_batch": (
+                "You are an independent pedagogy critic judging {{num_candidates}} tutor responses to the same observation.\n"
+                "Score each candidate on clarity, factual accuracy, quality of grounding, and hallucination risk,\n"
+                "then choose the best candidate overall. Use the retrieved snippets for reference.\n"
+                "Output BEGIN_STRICT_JSON ... END_STRICT_JSON with keys:\n"
+                "  {\n"
+                '    "candidates": [{"index": integer (0-based), "clarity": number 0..1, "accuracy": number 0..1,\n'
+                '      "support": number 0..1, "hallucination_flag": boolean, "notes": string (≤280 chars),\n'
+                '      "confidence": number 0..1, "score": number 0..1}],\n'
+                '    "chosen": integer index of the preferred candidate (0-based),\n'
+                '    "confidence": number 0..1,\n'
+                '    "reason": string (≤200 chars)\n'
+                "  }\n"
+                "Observation:\n"
+                "  Focus concept: {{focus_concept}}\n"
+                "  Classifier intent: {{intent}}\n"
+                "  Retrieved snippets:\n"
+                "{{retrieved_context}}\n"
+                "Candidates:\n"
+                "{{candidate_responses}}\n"
+                "Prior ranking from validator rewards (best first): {{prior_ranking}}\n"
+                "Verify this ranking against the responses and override it whenever your judgement differs.\n"
+                "Respond with strict JSON only.\n"
+                "BEGIN_STRICT_JSON\n"
+                "{\n"
+                '  "candidates": [{"index": 0, "clarity": 0.8, "accuracy": 0.8, "support": 0.8, "hallucination_flag": false, "notes": "", "confidence": 0.75, "score": 0.7}],\n'
+                '  "chosen": 0,\n'
+                '  "confidence": 0.6,\n'
+                '  "reason": ""\n'
+                "}\n"
+                "END_STRICT_JSON"
+            ),
         },
     }
 
@@ -12,7 +12,8 @@ ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
-from agents.tutor.critic import preference_with_critic, score_with_critic
+import agents.tutor.critic as critic_module
+from agents.tutor.critic import batch_score_with_critic, preference_with_critic, score_with_critic
 
 
 @pytest.fixture()
@@ -93,3 +94,66 @@ def test_preference_with_critic_prefers_higher_reward(observation):
     assert len(decision["scores"]) == len(candidates)
     assert decision["confidence"] >= 0.6
 
+
+def test_batch_score_with_critic_mock_matches_separate_calls(observation):
+    candidates: List[Dict[str, object]] = [
+        {
+            "action": {"type": "explain"},
+            "response": "Conduction moves heat through solids via particle collisions.",
+            "reward": {"total": 0.62},
+            "response_metadata": {"source_chunk_ids": ["chunk-1"]},
+        },
+        {
+            "action": {"type": "ask"},
+            "response": "Can you describe conduction?",
+            "reward": {"total": 0.78},
+        },
+    ]
+
+    judged = batch_score_with_critic(observation, candidates)
+
+    expected_critics = [
+        score_with_critic(observation, c["response"], c.get("response_metadata")) for c in candidates
+    ]
+    assert judged["critics"] == expected_critics
+    expected_pref = preference_with_critic(
+        observation,
+        [dict(c, critic=critic) for c, critic in zip(candidates, expected_critics)],
+    )
+    assert judged["preference"] == expected_pref
+
+
+def test_batch_score_with_critic_distributes_judge_output(observation, monkeypatch: pytest.MonkeyPatch):
+    calls: List[str] = []
+
+    def fake_call_json_chat(prompt, *, default, **kwargs):
+        calls.append(prompt)
+        return {
+            "candidates": [
+                {"index": 1, "clarity": 0.9, "accuracy": 0.95, "support": 0.9, "hallucination_flag": False,
+                 "notes": "strong", "confidence": 0.9, "score": 0.92, "extra": "dropped"},
+                {"index": 0, "clarity": 0.3, "accuracy": 0.5, "support": 0.4, "hallucination_flag": True,
+                 "notes": "weak", "confidence": 0.35, "score": 0.2},
+            ],
+            "chosen": 1,
+            "confidence": 0.8,
+            "reason": "candidate 1 is grounded",
+        }
+
+    monkeypatch.setattr(critic_module, "call_json_chat", fake_call_json_chat)
+    candidates = [
+        {"action": {"type": "explain"}, "response": "A vague answer.", "reward": {"total": 0.7}},
+        {"action": {"type": "ask"}, "response": "Conduction is heat flow via collisions.", "reward": {"total": 0.5}},
+    ]
+
+    judged = batch_score_with_critic(observation, candidates, prompt_set="baseline")
+
+    assert len(calls) == 1
+    # Candidate 0 has the higher validator reward, so it leads the prior ranking
+    assert "(best first): 0 > 1" in calls[0]
+    assert judged["critics"][0]["hallucination_flag"] is True
+    assert judged["critics"][1]["accuracy"] == 0.95
+    assert "extra" not in judged["critics"][1]
+    assert judged["critics"][1]["prompt_set"] == "baseline"
+    assert judged["preference"]["chosen"] == 1
+    assert judged["preference"]["scores"] == [0.2, 0.92]
@@ -15,7 +15,13 @@ if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
 from backend.schemas.tutor_rl import PreferenceRecord, SFTRecord
-from scripts.validate_tutor_datasets import validate_prefs, validate_sft
+from scripts.validate_tutor_datasets import (
+    _format_issue,
+    _redact_record,
+    main as validate_main,
+    validate_prefs,
+    validate_sft,
+)
 
 
 @pytest.fixture()
@@ -161,3 +167,174 @@ def test_validate_scripts_detect_weight_error(tmp_path, sample_observation):
     assert pref_errors
     assert "scores length" in pref_errors[0]
 
+
+def test_validate_on_error_sink(tmp_path, sample_observation):
+    pref_record = {
+        "observation": sample_observation,
+        "candidates": [
+            {"action": {"type": "explain"}, "response": "opt a"},
+            {"action": {"type": "ask"}, "response": "opt b"},
+        ],
+        "preference": {"chosen": 0, "scores": [0.8], "confidence": 0.6},
+    }
+    prefs_path = tmp_path / "prefs.jsonl"
+    prefs_path.write_text((json.dumps(pref_record) + "\n") * 2, encoding="utf-8")
+
+    collected = validate_prefs(prefs_path)
+    streamed: list = []
+    assert validate_prefs(prefs_path, on_error=streamed.append) == []
+    assert [_format_issue(prefs_path, issue) for issue in streamed] == collected
+    assert [issue[0] for issue in streamed] == [1, 2]
+
+
+def test_validate_sft_redacts_ids_without_touching_input(tmp_path, sample_observation):
+    record = {
+        "observation": sample_observation,
+        "action": sample_observation["action"],
+        "response": "Conduction transfers heat.",
+        "reward": _reward_payload(),
+    }
+    changed, redacted = _redact_record(record)
+    assert changed
+    assert _redact_record(redacted) == (False, redacted)
+    assert "user_id" not in redacted["observation"]["user"]
+    assert "session_id" not in redacted["observation"]["session"]
+    assert list(redacted["observation"]) == list(sample_observation)
+    assert sample_observation["user"]["user_id"] == "user-123"
+    assert sample_observation["session"]["session_id"] == "session-xyz"
+
+    sft_path = tmp_path / "sft.jsonl"
+    already_redacted = json.dumps(redacted)
+    sft_path.write_text(json.dumps(record) + "\n" + already_redacted + "\n", encoding="utf-8")
+    redact_dir = tmp_path / "redacted"
+    assert validate_sft(sft_path, redact_dir=redact_dir) == []
+    lines = (redact_dir / "sft.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [redacted, redacted]
+    # Records without sensitive ids are copied through byte-for-byte
+    assert lines[1] == already_redacted
+
+
+def test_validate_sft_accepts_numbers_outside_double_range(tmp_path, sample_observation):
+    record = {
+        "observation": sample_observation,
+        "action": sample_observation["action"],
+        "response": "Conduction transfers heat.",
+        "reward": _reward_payload(),
+    }
+    line = json.dumps(record).replace('"version": 1', '"version": 1, "scale": 1e400')
+    sft_path = tmp_path / "sft.jsonl"
+    sft_path.write_text(line + "\n", encoding="utf-8")
+
+    assert validate_sft(sft_path) == []
+
+
+def test_validate_sft_redaction_keeps_wide_and_non_finite_numbers(tmp_path, sample_observation):
+    record = {
+        "observation": sample_observation,
+        "action": sample_observation["action"],
+        "response": "Conduction transfers heat.",
+        "reward": _reward_payload(),
+    }
+    wide = 123456789012345678901234567890
+    line = json.dumps(record).replace('"version": 1', f'"version": 1, "trace": {wide}, "scale": 1e400')
+    sft_path = tmp_path / "sft.jsonl"
+    sft_path.write_text(line + "\n", encoding="utf-8")
+
+    assert validate_sft(sft_path, redact_dir=tmp_path / "redacted") == []
+    redacted = json.loads((tmp_path / "redacted" / "sft.jsonl").read_text(encoding="utf-8"))
+    assert "user_id" not in redacted["observation"]["user"]
+    assert redacted["observation"]["metadata"] == {"version": 1, "trace": wide, "scale": float("inf")}
+
+
+def test_validate_sft_parallel_matches_serial(tmp_path, sample_observation):
+    good = {
+        "observation": sample_observation,
+        "action": sample_observation["action"],
+        "response": "Conduction transfers heat.",
+        "reward": _reward_payload(),
+    }
+    bad = {**good, "reward": {**_reward_payload(), "normalized_weights": {"rubric": 0.5}}}
+    lines = [json.dumps(bad if idx % 7 == 3 else good) for idx in range(40)]
+    lines.insert(10, "")
+    sft_path = tmp_path / "sft.jsonl"
+    sft_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    serial = validate_sft(sft_path, redact_dir=tmp_path / "serial")
+    parallel = validate_sft(sft_path, redact_dir=tmp_path / "parallel", jobs=3)
+
+    assert parallel == serial
+    assert serial[0].startswith(f"{sft_path}:4 - normalized weight")
+    assert (tmp_path / "parallel" / "sft.jsonl").read_bytes() == (tmp_path / "serial" / "sft.jsonl").read_bytes()
+    assert sorted(p.name for p in (tmp_path / "parallel").iterdir()) == ["sft.jsonl", "sft.jsonl.stamp"]
+
+
+def test_validate_sft_skips_up_to_date_redaction(tmp_path, sample_observation):
+    record = {
+        "observation": sample_observation,
+        "action": sample_observation["action"],
+        "response": "Conduction transfers heat.",
+        "reward": _reward_payload(),
+    }
+    sft_path = tmp_path / "sft.jsonl"
+    sft_path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+    redact_dir = tmp_path / "redacted"
+    out_path = redact_dir / "sft.jsonl"
+
+    assert validate_sft(sft_path, redact_dir=redact_dir) == []
+    out_path.write_bytes(b"sentinel\n")
+    assert validate_sft(sft_path, redact_dir=redact_dir) == []
+    assert out_path.read_bytes() == b"sentinel\n"
+
+    sft_path.write_text(json.dumps(record) + "\n" + json.dumps(record) + "\n", encoding="utf-8")
+    assert validate_sft(sft_path, redact_dir=redact_dir) == []
+    assert len(out_path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_validate_main_reports_up_to_date_redaction(tmp_path, sample_observation, capsys):
+    record = {
+        "observation": sample_observation,
+        "action": sample_observation["action"],
+        "response": "Conduction transfers heat.",
+        "reward": _reward_payload(),
+    }
+    sft_path = tmp_path / "sft.jsonl"
+    sft_path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+    argv = ["--sft", str(sft_path), "--redact", str(tmp_path / "redacted")]
+
+    assert validate_main(argv) == 0
+    assert "Redacted copies written to" in capsys.readouterr().out
+    assert validate_main(argv) == 0
+    out = capsys.readouterr().out
+    assert "Redacted copies already up to date" in out
+    assert "written" not in out
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_validate_sft_only_commits_complete_redaction(tmp_path, sample_observation, jobs):
+    record = {
+        "observation": sample_observation,
+        "action": sample_observation["action"],
+        "response": "Conduction transfers heat.",
+        "reward": _reward_payload(),
+    }
+    sft_path = tmp_path / "sft.jsonl"
+    redact_dir = tmp_path / "redacted"
+    out_path = redact_dir / "sft.jsonl"
+    stamp_path = redact_dir / "sft.jsonl.stamp"
+    sft_path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+    assert validate_sft(sft_path, redact_dir=redact_dir, jobs=jobs) == []
+    previous = out_path.read_bytes()
+
+    # Every record invalid: the old copy is left alone but no longer stamped as current
+    sft_path.write_text(json.dumps({"response": "no observation"}) + "\n", encoding="utf-8")
+    assert validate_sft(sft_path, redact_dir=redact_dir, jobs=jobs)
+    assert out_path.read_bytes() == previous
+    assert not stamp_path.exists()
+
+    # Parse error partway through: no partial copy replaces the old one
+    lines = [json.dumps(record)] * 20 + ["{not json"] + [json.dumps(record)] * 20
+    sft_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="line 21"):
+        validate_sft(sft_path, redact_dir=redact_dir, jobs=jobs)
+    assert out_path.read_bytes() == previous
+    assert sorted(p.name for p in redact_dir.iterdir()) == ["sft.jsonl"]
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 import os
 import sys
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -14,7 +16,16 @@ for candidate in (BACKEND_DIR, ROOT_DIR, ROOT_DIR / "scripts"):
     if str(candidate) not in sys.path:
         sys.path.insert(0, str(candidate))
 
-from scripts.tutor_rollout_bandit import main as rollout_main
+from scripts.tutor_rollout_bandit import (
+    DEFAULT_MAX_CONCURRENCY,
+    RolloutConfig,
+    _cached_call,
+    _encoded_rows,
+    _records,
+    main as rollout_main,
+    parse_args,
+    run_rollout,
+)
 from scripts.validate_tutor_datasets import validate_prefs, validate_sft
 
 
@@ -138,3 +149,174 @@ def test_rollout_mock_mode(tmp_path: Path, observation_entries: list[dict[str, o
         assert len(record["candidates"]) == 2
         assert len(record["preference"]["scores"]) == 2
 
+
+def test_rollout_keeps_wide_and_non_finite_numbers(
+    tmp_path: Path, observation_entries: list[dict[str, object]]
+):
+    wide = 123456789012345678901234567890
+    observations_path = tmp_path / "observations.jsonl"
+    observations_path.write_text(
+        "\n".join(
+            json.dumps(entry).replace('"version": 1', f'"version": 1, "trace": {wide}, "scale": 1e400')
+            for entry in observation_entries
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    out_dir = tmp_path / "out"
+    os.environ["USE_LLM_MOCK"] = "1"
+    assert rollout_main(
+        ["--observations", str(observations_path), "--out-dir", str(out_dir), "--candidates", "2", "--mock"]
+    ) == 0
+
+    for name in ("sft.jsonl", "prefs.jsonl"):
+        for line in (out_dir / name).read_text(encoding="utf-8").splitlines():
+            metadata = json.loads(line)["observation"]["metadata"]
+            assert metadata["trace"] == wide
+            assert metadata["scale"] == float("inf")
+
+
+def test_cached_call_reuses_results_per_prompt_set(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    calls: list[int] = []
+
+    def compute() -> dict[str, object]:
+        calls.append(1)
+        return {"response": "cached", "n": len(calls)}
+
+    request = {"payload": {"message": "hi"}, "action_type": "explain", "model_hint": None}
+    monkeypatch.setenv("PROMPT_SET", "baseline")
+    first = _cached_call(tmp_path, "tutor", request, compute)
+    second = _cached_call(tmp_path, "tutor", request, compute)
+    assert first == second == {"response": "cached", "n": 1}
+
+    monkeypatch.setenv("PROMPT_SET", "concise")
+    third = _cached_call(tmp_path, "tutor", request, compute)
+    assert third["n"] == 2
+    assert _cached_call(None, "tutor", request, compute)["n"] == 3
+
+
+def test_encoded_rows_match_records(observation_entries: list[dict[str, object]]):
+    observation = observation_entries[0]["observation"]
+    prepared = {
+        "candidates": [
+            {
+                "observation": observation,
+                "action": {"type": action},
+                "response": f"Response {idx} — é",
+                "reward": {"total": 0.5 + idx / 10},
+                "critic": None,
+                "meta": {"candidate_index": idx},
+            }
+            for idx, action in enumerate(["explain", "ask"])
+        ],
+        "preference": {"preferred_index": 1, "scores": [0.5, 0.6]},
+    }
+
+    encoded = _encoded_rows(prepared)
+    records = _records(prepared)
+    assert [kind for kind, _ in encoded] == [kind for kind, _ in records] == ["sft", "sft", "prefs"]
+    for (_, line), (_, record) in zip(encoded, records):
+        assert line.endswith(b"\n")
+        assert json.loads(line) == record
+
+
+def test_rollout_resume_skips_processed_and_drops_partial_rows(
+    tmp_path: Path, observation_entries: list[dict[str, object]]
+):
+    observations_path = tmp_path / "observations.jsonl"
+    observations_path.write_text(
+        "\n".join(json.dumps(entry) for entry in observation_entries) + "\n",
+        encoding="utf-8",
+    )
+    os.environ["USE_LLM_MOCK"] = "1"
+
+    def run(out_dir: Path, *extra: str) -> None:
+        args = [
+            "--observations", str(observations_path),
+            "--out-dir", str(out_dir),
+            "--candidates", "2",
+            "--mock",
+            "--seed", "7",
+            "--parallelism", "1",
+            *extra,
+        ]
+        assert rollout_main(args) == 0
+
+    full_dir = tmp_path / "full"
+    run(full_dir)
+
+    resumed_dir = tmp_path / "resumed"
+    run(resumed_dir)
+    # Simulate a crash after the second entry's rows were written but before its checkpoint
+    manifest_path = resumed_dir / ".processed"
+    manifest_lines = manifest_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    assert len(manifest_lines) == 2
+    manifest_path.write_text(manifest_lines[0], encoding="utf-8")
+    with (resumed_dir / "sft.jsonl").open("ab") as handle:
+        handle.write(b'{"partial": ')
+
+    run(resumed_dir, "--resume")
+    for name in ("sft.jsonl", "prefs.jsonl", ".processed"):
+        assert (resumed_dir / name).read_bytes() == (full_dir / name).read_bytes()
+
+
+@pytest.fixture()
+def fake_llm(monkeypatch: pytest.MonkeyPatch, observation_entries: list[dict[str, object]]) -> list[int]:
+    """Stub tutor and critic calls; returns ``[in_flight, peak_in_flight]`` counters."""
+    import scripts.tutor_rollout_bandit as rollout_module
+
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def tracked(result):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return result
+
+    def fake_tutor(payload, *, action_type, model_hint=None):
+        observation = json.loads(json.dumps(observation_entries[0]["observation"]))
+        return tracked({"response": f"{action_type} reply", "observation": observation, "action_type": action_type})
+
+    def fake_critic(observation, candidates, **_):
+        critics = [{"score": 0.5} for _ in candidates]
+        return tracked({"critics": critics, "preference": {"chosen": 0, "scores": [0.5] * len(candidates)}})
+
+    monkeypatch.setenv("USE_LLM_MOCK", "1")
+    monkeypatch.setattr(rollout_module, "_call_tutor_agent", fake_tutor)
+    monkeypatch.setattr(rollout_module, "batch_score_with_critic", fake_critic)
+    return in_flight
+
+
+def _live_config(**overrides: object) -> RolloutConfig:
+    fields = dict(
+        actions=("explain", "ask", "hint"),
+        candidates=3,
+        prompt_set=None,
+        mock_mode=False,
+        seed=None,
+        parallelism=4,
+        candidate_parallelism=3,
+    )
+    fields.update(overrides)
+    return RolloutConfig(**fields)
+
+
+def test_rollout_caps_in_flight_tutor_and_critic_calls(
+    fake_llm: list[int], observation_entries: list[dict[str, object]]
+):
+    results = run_rollout(observation_entries * 4, config=_live_config(max_concurrency=2))
+
+    assert len(results["prefs"]) == 8
+    assert 1 <= fake_llm[1] <= 2
+    assert parse_args(["--observations", "o", "--out-dir", "d"]).max_concurrency == DEFAULT_MAX_CONCURRENCY
+
+
+def test_rollout_shuts_down_candidate_pool(fake_llm: list[int], observation_entries: list[dict[str, object]]):
+    for parallelism in (2, 3):
+        run_rollout(observation_entries, config=_live_config(parallelism=parallelism))
+
+    assert not [t for t in threading.enumerate() if t.name.startswith("rollout-candidate")]
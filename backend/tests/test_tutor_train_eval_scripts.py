@@ -13,10 +13,18 @@ for candidate in (BACKEND_DIR, ROOT_DIR, ROOT_DIR / "scripts"):
         sys.path.insert(0, str(candidate))
 
 from api.rl_tools import RolloutRequest, api_rollout
-from scripts.train_tutor_pref import main as train_main
+import scripts.train_tutor_pref as train_module
+from scripts.train_tutor_pref import _format_pref_pairs, _unique_pair_indices, main as train_main
 from scripts.eval_tutor_bandit import main as eval_main
 
 
+@pytest.fixture(autouse=True)
+def shared_mock_adapter(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    shared = tmp_path / "cache" / "mock_adapter.bin"
+    monkeypatch.setattr(train_module, "SHARED_MOCK_ADAPTER", shared)
+    return shared
+
+
 @pytest.fixture()
 def prefs_path() -> Path:
     return ROOT_DIR / "sample" / "mock_rollout" / "prefs.jsonl"
@@ -53,6 +61,47 @@ def test_train_pref_mock(tmp_path: Path, prefs_path: Path):
     assert metrics["mode"] == "mock"
 
 
+def test_train_pref_mock_skips_rewrite_when_key_matches(tmp_path: Path, prefs_path: Path):
+    output_dir = tmp_path / "adapter"
+    argv = ["--prefs", str(prefs_path), "--output-dir", str(output_dir), "--mock", "--seed", "7"]
+    assert train_main(argv) == 0
+    metrics_path = output_dir / "metrics.json"
+    assert (output_dir / ".mock_key").exists()
+    first_mtime = metrics_path.stat().st_mtime_ns
+    assert train_main(argv) == 0
+    assert metrics_path.stat().st_mtime_ns == first_mtime
+
+
+def test_train_pref_mock_links_shared_adapter(tmp_path: Path, prefs_path: Path, shared_mock_adapter: Path):
+    for name in ("first", "second"):
+        argv = ["--prefs", str(prefs_path), "--output-dir", str(tmp_path / name), "--mock", "--seed", "7"]
+        assert train_main(argv) == 0
+
+    assert shared_mock_adapter.read_bytes() == train_module.MOCK_ADAPTER_BYTES
+    assert shared_mock_adapter.stat().st_nlink == 3
+    assert os.path.samefile(tmp_path / "first" / "adapter.bin", tmp_path / "second" / "adapter.bin")
+
+
+def test_unique_pair_indices_keeps_first_occurrence():
+    prompts = ["p1", "p1", "p2", "p1"]
+    chosen = ["a", "a", "a", "b"]
+    rejected = ["x", "x", "x", "x"]
+    assert _unique_pair_indices(prompts, chosen, rejected) == [0, 2, 3]
+
+
+def test_format_pref_pairs_keeps_each_observation_verbatim():
+    candidates = [{"response": "a"}, {"response": "b"}]
+    records = [
+        {"observation": {"topic": "héat", "tags": ["x"]}, "candidates": candidates, "preference": {"chosen": 1}},
+        {"observation": {"tags": "x", "extra": 1}, "candidates": candidates, "preference": {"chosen": 0}},
+        {"observation": {"topic": "skip"}, "candidates": candidates[:1], "preference": {"chosen": 0}},
+    ]
+    columns = _format_pref_pairs(records)
+    assert columns["prompt"] == [json.dumps(rec["observation"], ensure_ascii=False) for rec in records[:2]]
+    assert columns["chosen"] == ["b", "a"]
+    assert columns["rejected"] == ["a", "b"]
+
+
 def test_eval_bandit(tmp_path: Path, sft_path: Path):
     os.environ["USE_LLM_MOCK"] = "1"
     out_dir = tmp_path / "report"
@@ -12,7 +12,7 @@ ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
-from agents.tutor.validators import score_response
+from agents.tutor.validators import batch_score_response, score_response
 
 
 @pytest.fixture()
@@ -131,3 +131,19 @@ def test_grounding_penalizes_unknown_ids(sample_observation):
     assert "unknown_grounding_ids" in grounding["flags"]
     assert "grounding_low" in grounding["flags"]
 
+
+def test_batch_score_response_matches_single_calls(sample_observation):
+    responses = [
+        "Conduction is the transfer of heat through solids because neighbouring particles collide.",
+        "Conduction is important, but convection and radiation also move energy.",
+    ]
+    metadatas = [{"source_chunk_ids": ["chunk-1"]}, {"source_chunk_ids": ["chunk-3"]}]
+
+    batched = batch_score_response([sample_observation] * 2, responses, metadatas)
+
+    assert batched == [
+        score_response(sample_observation, response, metadata)
+        for response, metadata in zip(responses, metadatas)
+    ]
+    with pytest.raises(ValueError):
+        batch_score_response([sample_observation], responses)
@@ -16,25 +16,50 @@ Defaults:
   Authorization header is set to the local dev token per project norms.
 """
 import argparse
+import gzip
 import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from urllib import request, parse, error
 
+try:
+    import orjson  # optional: faster encoding for large upsert bodies
+except ImportError:
+    orjson = None
+
 DEFAULT_BASE = os.environ.get("SMOKE_BASE", "http://localhost:8000")
 DEFAULT_RID = os.environ.get("SMOKE_RID", "9f65b917-1b6c-4ca3-8581-ae35a5ef91f8")
 AUTH_HEADER = ("Authorization", os.environ.get("SMOKE_AUTH", "Bearer test-token"))
-
-
-def http_json(method: str, url: str, body: dict | None = None, headers: dict | None = None, timeout: float = 60.0):
+# request-body gzip is opt-in: the backend must decompress Content-Encoding: gzip bodies
+GZIP_REQUESTS = os.environ.get("SMOKE_GZIP", "0") == "1"
+GZIP_MIN_BYTES = 4096
+
+
+def http_json(
+    method: str,
+    url: str,
+    body: dict | None = None,
+    headers: dict | None = None,
+    timeout: float = 60.0,
+    compress: bool | None = None,
+):
     data = None
+    gzipped = False
     if body is not None:
-        data = json.dumps(body).encode("utf-8")
+        data = orjson.dumps(body) if orjson is not None else json.dumps(body).encode("utf-8")
+        if (GZIP_REQUESTS if compress is None else compress) and len(data) > GZIP_MIN_BYTES:
+            data = gzip.compress(data, compresslevel=1)
+            gzipped = True
     req = request.Request(url, data=data, method=method)
     req.add_header(*AUTH_HEADER)
+    req.add_header("Accept-Encoding", "gzip")
     if body is not None:
         req.add_header("Content-Type", "application/json")
+    if gzipped:
+        req.add_header("Content-Encoding", "gzip")
     if headers:
         for k, v in headers.items():
             req.add_header(k, v)
@@ -42,6 +67,8 @@ def http_json(method: str, url: str, body: dict | None = None, headers: dict | N
         with request.urlopen(req, timeout=timeout) as resp:
             ct = resp.headers.get("Content-Type", "")
             raw = resp.read()
+            if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+                raw = gzip.decompress(raw)
             if "application/json" in ct or raw.startswith(b"{") or raw.startswith(b"["):
                 try:
                     return json.loads(raw.decode("utf-8"))
@@ -49,18 +76,60 @@ def http_json(method: str, url: str, body: dict | None = None, headers: dict | N
                     return {"_raw": raw.decode("utf-8", errors="ignore")}
             return {"_raw": raw.decode("utf-8", errors="ignore")}
     except error.HTTPError as e:
-        raw = e.read().decode("utf-8", errors="ignore")
+        raw = e.read()
+        if e.headers.get("Content-Encoding", "").lower() == "gzip":
+            raw = gzip.decompress(raw)
+        raw = raw.decode("utf-8", errors="ignore")
         return {"_error": f"HTTP {e.code}", "detail": raw}
     except Exception as e:
         return {"_error": str(e)}
 
 
+def estimate_tokens(chunk: dict) -> int:
+    return (chunk.get("token_count") or len(chunk.get("snippet") or "") // 4) + 1
+
+
+def token_aware_batches(chunks, target_tokens: int = 8000, max_ids: Optional[int] = None):
+    """Yield (chunk_ids, estimated_tokens) batches sized to a token budget (and at most max_ids ids if set)."""
+    batch, cur = [], 0
+    for c in chunks:
+        if not c.get("id"):
+            continue
+        n = estimate_tokens(c)
+        if batch and (cur + n > target_tokens or (max_ids and len(batch) >= max_ids)):
+            yield batch, cur
+            batch, cur = [], 0
+        batch.append(c["id"])
+        cur += n
+    if batch:
+        yield batch, cur
+
+
+def upsert_embeddings(base: str, chunks, target_tokens: int, max_ids: Optional[int] = None, compress: bool = False) -> list:
+    """POST token-aware batches to /api/embeddings/upsert and return per-batch results."""
+    results = []
+    for batch, est_tokens in token_aware_batches(chunks, target_tokens, max_ids):
+        t0 = time.perf_counter()
+        res = http_json("POST", f"{base}/api/embeddings/upsert", {"chunk_ids": batch}, timeout=300.0, compress=compress)
+        results.append({
+            "ids": len(batch),
+            "est_tokens": est_tokens,
+            "took_ms": int((time.perf_counter() - t0) * 1000),
+            "result": res,
+        })
+    return results
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--rid", default=DEFAULT_RID, help="resource UUID to smoke test")
     ap.add_argument("--base", default=DEFAULT_BASE, help="backend base URL (default http://localhost:8000)")
     ap.add_argument("--force", action="store_true", help="force re-chunking even if chunks exist")
     ap.add_argument("--limit", type=int, default=200, help="max chunks to fetch for this test")
+    ap.add_argument("--batch-size", type=int, default=None, help="optional cap on chunk ids per embeddings upsert request (default: sized by --target-tokens only)")
+    ap.add_argument("--gzip", action="store_true", default=GZIP_REQUESTS, help="gzip large upsert request bodies (server must accept Content-Encoding: gzip)")
+    ap.add_argument("--sequential", action="store_true", help="run BM25 recompute and embeddings upsert one after another")
+    ap.add_argument("--target-tokens", type=int, default=8000, help="estimated token budget per embeddings upsert request")
     args = ap.parse_args()
 
     base = args.base.rstrip("/")
@@ -106,14 +175,27 @@ def main():
     else:
         print("[info] chunks already exist; skipping re-chunking (use --force to re-run)")
 
-    # recompute BM25
-    print("[bm25] POST /api/admin/recompute-search-tsv")
-    print(http_json("POST", f"{base}/api/admin/recompute-search-tsv", timeout=180.0))
+    # recompute BM25 and upsert embeddings; they touch different columns so run them concurrently
+    def recompute_bm25():
+        return http_json("POST", f"{base}/api/admin/recompute-search-tsv", timeout=180.0)
+
+    max_ids = max(1, args.batch_size) if args.batch_size is not None else None
+
+    def upsert():
+        return upsert_embeddings(base, chunks, args.target_tokens, max_ids, compress=args.gzip)
 
-    # upsert embeddings for these chunks
-    chunk_ids = [c.get("id") for c in chunks if c.get("id")]
-    print(f"[emb] POST /api/embeddings/upsert (ids={len(chunk_ids)})")
-    print(http_json("POST", f"{base}/api/embeddings/upsert", {"chunk_ids": chunk_ids}, timeout=300.0))
+    print("[bm25] POST /api/admin/recompute-search-tsv")
+    print("[emb] POST /api/embeddings/upsert (token-aware batches)")
+    if args.sequential:
+        bm25_res, emb_res = recompute_bm25(), upsert()
+    else:
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            bm25_f = ex.submit(recompute_bm25)
+            emb_f = ex.submit(upsert)
+            bm25_res, emb_res = bm25_f.result(), emb_f.result()
+    print({"bm25": bm25_res})
+    for entry in emb_res:
+        print({"emb": entry})
 
     # searches
     for q in ("heat flux", "convection"):
@@ -159,22 +159,26 @@ def test_retrieval_filtering():
             multi_count = cur.fetchone()[0]
             print(f"✓ Found {multi_count} chunks with roles 'definition' or 'explanation'")
             
-            # Test role distribution
+        # Test role distribution. The IS NOT NULL predicate matches the partial
+        # expression index idx_chunk_pedagogy_role (02-chunks.sql, ensure_schema),
+        # which the planner can use to find tagged rows; each row is still read
+        # from the heap. A named (server-side) cursor streams rows rather than
+        # buffering the result.
+        with conn.cursor(name="peda_dist") as cur:
             cur.execute("""
                 SELECT 
                     tags->>'pedagogy_role' as role,
                     COUNT(*) as count
                 FROM chunk
                 WHERE tags->>'pedagogy_role' IS NOT NULL
-                GROUP BY tags->>'pedagogy_role'
-                ORDER BY count DESC
+                GROUP BY 1
+                ORDER BY 2 DESC
             """)
             print("\nRole distribution:")
-            for row in cur.fetchall():
-                role, count = row
+            for role, count in cur:
                 print(f"  {role:15} {count:4} chunks")
             
-            return True
+        return True
     finally:
         conn.close()
 
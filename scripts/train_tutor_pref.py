@@ -7,19 +7,32 @@ mode that produces LoRA-style artifacts for CI smoke tests."""
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import heapq
 import json
 import logging
 import os
 import random
 import sys
+from array import array
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:  # optional fast JSON encoder
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - fallback to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+MOCK_KEY_FILE = ".mock_key"
+SHARED_MOCK_ADAPTER = Path.home() / ".cache" / "study_agent" / "mock_adapter.bin"
+MOCK_ADAPTER_BYTES = b"mock-adapter-weights"
+
 
 def _load_jsonl(path: Path) -> List[Dict[str, Any]]:
     if not path.exists():
@@ -42,8 +55,9 @@ def _load_jsonl(path: Path) -> List[Dict[str, Any]]:
 
 
 def _preference_statistics(records: List[Dict[str, Any]]) -> Dict[str, Any]:
-    chosen_scores: List[float] = []
-    margins: List[float] = []
+    chosen_scores = array("d", bytes(8 * len(records)))
+    margins = array("d", bytes(8 * len(records)))
+    ci = mi = 0
     for rec in records:
         pref = rec.get("preference") or {}
         chosen = pref.get("chosen", 0)
@@ -51,13 +65,14 @@ def _preference_statistics(records: List[Dict[str, Any]]) -> Dict[str, Any]:
         if not scores:
             continue
         chosen_idx = max(0, min(int(chosen), len(scores) - 1))
-        chosen_score = float(scores[chosen_idx])
-        chosen_scores.append(chosen_score)
+        chosen_scores[ci] = float(scores[chosen_idx])
+        ci += 1
         if len(scores) >= 2:
-            sorted_scores = sorted(float(s) for s in scores)
-            margins.append(sorted_scores[-1] - sorted_scores[-2])
-    avg_chosen = sum(chosen_scores) / len(chosen_scores) if chosen_scores else 0.0
-    avg_margin = sum(margins) / len(margins) if margins else 0.0
+            top, second = heapq.nlargest(2, (float(s) for s in scores))
+            margins[mi] = top - second
+            mi += 1
+    avg_chosen = sum(memoryview(chosen_scores)[:ci]) / ci if ci else 0.0
+    avg_margin = sum(memoryview(margins)[:mi]) / mi if mi else 0.0
     return {
         "num_pairs": len(records),
         "avg_chosen_score": round(avg_chosen, 4),
@@ -65,6 +80,66 @@ def _preference_statistics(records: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def _write_json(path: Path, obj: Any) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+
+
+def _write_mock_adapter(path: Path) -> None:
+    """Hardlink the shared mock adapter (created on first use), else write the stub bytes."""
+    if path.exists():
+        path.unlink()
+    try:
+        if not SHARED_MOCK_ADAPTER.exists() or SHARED_MOCK_ADAPTER.read_bytes() != MOCK_ADAPTER_BYTES:
+            SHARED_MOCK_ADAPTER.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = SHARED_MOCK_ADAPTER.with_name(f"{SHARED_MOCK_ADAPTER.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(MOCK_ADAPTER_BYTES)
+            os.replace(tmp_path, SHARED_MOCK_ADAPTER)
+        os.link(SHARED_MOCK_ADAPTER, path)
+        return
+    except OSError:
+        pass
+    path.write_bytes(MOCK_ADAPTER_BYTES)
+
+
+def _format_pref_pairs(records: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Turn preference records into flat prompt/chosen/rejected string columns.
+
+    Prompts always use ``json.dumps(obs, ensure_ascii=False)`` so the training
+    text does not depend on which JSON codec is installed. Records with fewer
+    than two candidates or an empty response are skipped."""
+    out: Dict[str, List[str]] = {"prompt": [], "chosen": [], "rejected": []}
+    for rec in records:
+        candidates = rec.get("candidates") or []
+        if len(candidates) < 2:
+            continue
+        chosen_idx = (rec.get("preference") or {}).get("chosen", 0)
+        chosen_idx = max(0, min(int(chosen_idx or 0), len(candidates) - 1))
+        chosen = (candidates[chosen_idx] or {}).get("response") or ""
+        rejected = (candidates[1 - chosen_idx] or {}).get("response") or ""
+        if not chosen or not rejected:
+            continue
+        out["prompt"].append(json.dumps(rec.get("observation"), ensure_ascii=False))
+        out["chosen"].append(chosen)
+        out["rejected"].append(rejected)
+    return out
+
+
+def _unique_pair_indices(prompts: List[str], chosen: List[str], rejected: List[str]) -> List[int]:
+    """Return indices of the first occurrence of each (prompt, chosen, rejected) triple."""
+    seen: set = set()
+    keep: List[int] = []
+    for idx, triple in enumerate(zip(prompts, chosen, rejected)):
+        key = hashlib.blake2b("\0".join(triple).encode("utf-8"), digest_size=16).digest()
+        if key in seen:
+            continue
+        seen.add(key)
+        keep.append(idx)
+    return keep
+
+
 def _mock_train(
     method: str,
     records: List[Dict[str, Any]],
@@ -72,8 +147,25 @@ def _mock_train(
     base_model: str,
     seed: Optional[int],
 ) -> Dict[str, Any]:
-    rng = random.Random(seed)
     stats = _preference_statistics(records)
+    key_file = output_dir / MOCK_KEY_FILE
+    metrics_path = output_dir / "metrics.json"
+    mock_key: Optional[str] = None
+    if seed is not None:
+        mock_key = hashlib.blake2b(
+            f"{method}|{base_model}|{stats['num_pairs']}|{stats['avg_chosen_score']}|{stats['avg_margin']}|{seed}".encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        if (
+            key_file.exists()
+            and key_file.read_text(encoding="utf-8") == mock_key
+            and metrics_path.exists()
+            and (output_dir / "adapter.bin").exists()
+        ):
+            logging.info("Mock artifacts in %s are up to date; skipping write", output_dir)
+            return json.loads(metrics_path.read_bytes())
+
+    rng = random.Random(seed)
     mock_loss_start = 1.0 - 0.1 * rng.random()
     mock_loss_end = mock_loss_start * (0.5 + 0.2 * rng.random())
 
@@ -90,7 +182,7 @@ def _mock_train(
     }
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    (output_dir / "metrics.json").write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+    _write_json(metrics_path, metrics)
 
     adapter_config = {
         "lora_target": "tutor_head",
@@ -100,16 +192,21 @@ def _mock_train(
         "base_model": base_model,
         "generated_by": "mock_train",
     }
-    (output_dir / "adapter_config.json").write_text(
-        json.dumps(adapter_config, indent=2), encoding="utf-8"
-    )
-    (output_dir / "adapter.bin").write_bytes(b"mock-adapter-weights")
+    _write_json(output_dir / "adapter_config.json", adapter_config)
+    _write_mock_adapter(output_dir / "adapter.bin")
+    if mock_key is not None:
+        key_file.write_text(mock_key, encoding="utf-8")
+    elif key_file.exists():
+        key_file.unlink()
 
     logging.info("Mock training complete; artifacts written to %s", output_dir)
     return metrics
 
 
+@functools.lru_cache(maxsize=1)
 def _trl_available() -> bool:
+    if "trl" in sys.modules:
+        return True
     try:  # pragma: no cover - import check
         import transformers  # type: ignore[import]  # noqa: F401
         import trl  # type: ignore[import]  # noqa: F401
@@ -151,31 +248,23 @@ def _real_train(
     tokenizer = AutoTokenizer.from_pretrained(base_model)
     tokenizer.pad_token = tokenizer.eos_token
 
-    formatted_records = []
-    for rec in records:
-        pref = rec.get("preference") or {}
-        candidates = rec.get("candidates") or []
-        chosen_idx = pref.get("chosen", 0)
-        chosen_idx = max(0, min(int(chosen_idx), len(candidates) - 1))
-        if len(candidates) < 2:
-            continue
-        pos = candidates[chosen_idx]
-        neg = candidates[1 - chosen_idx]
-        obs = rec.get("observation")
-        prompt = json.dumps(obs, ensure_ascii=False)
-        formatted_records.append(
-            {
-                "prompt": prompt,
-                "chosen": pos.get("response", ""),
-                "rejected": neg.get("response", ""),
-            }
-        )
+    # Only flat string columns reach Arrow: nested observation dicts would be
+    # merged into struct columns, padding every row with other rows' keys as None
+    dataset = Dataset.from_dict(_format_pref_pairs(records))
 
-    if not formatted_records:
+    if len(dataset) == 0:
         logging.warning("No usable pairs after preprocessing; falling back to mock")
         return _mock_train(method, records, output_dir, base_model, seed)
 
-    dataset = Dataset.from_list(formatted_records)
+    unique_indices = _unique_pair_indices(dataset["prompt"], dataset["chosen"], dataset["rejected"])
+    if len(unique_indices) < len(dataset):
+        logging.info(
+            "Deduplicated preference pairs: %d -> %d (ratio %.2f)",
+            len(dataset),
+            len(unique_indices),
+            len(dataset) / len(unique_indices),
+        )
+        dataset = dataset.select(unique_indices)
 
     lora_config = LoraConfig(
         r=lora_r,
@@ -221,7 +310,8 @@ def _real_train(
         "seed": seed,
         "mode": "trl",
     }
-    (output_dir / "metrics.json").write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+    _write_json(output_dir / "metrics.json", metrics)
+    (output_dir / MOCK_KEY_FILE).unlink(missing_ok=True)
     logging.info("Training complete; artifacts in %s", output_dir)
     return metrics
 
@@ -8,15 +8,28 @@ emit SFT and preference JSONL datasets."""
 from __future__ import annotations
 
 import argparse
-import copy
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import os
+import math
 import random
+import re
 import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, ContextManager, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+try:  # optional fast JSON codec; stdlib json is the fallback
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
 
 
 # Add backend to path for CLI usage
@@ -29,13 +42,12 @@ from agents.tutor.agent import tutor_agent  # type: ignore  # noqa: E402
 from agents.tutor.validators import (  # type: ignore  # noqa: E402
     RewardWeights,
     ValidatorConfig,
-    score_response,
-)
-from agents.tutor.critic import (  # type: ignore  # noqa: E402
-    preference_with_critic,
-    score_with_critic,
+    batch_score_response,
 )
+from agents.tutor.critic import batch_score_with_critic  # type: ignore  # noqa: E402
+
 
+MANIFEST_FILE = ".processed"  # Per-run checkpoint of processed observation ids for --resume
 
 DEFAULT_ACTIONS: Sequence[str] = (
     "explain",
@@ -46,8 +58,12 @@ DEFAULT_ACTIONS: Sequence[str] = (
     "review",
 )
 
+# Each real tutor/critic call opens its own DB connection, so the default cap
+# stays well below the observation x candidate fan-out
+DEFAULT_MAX_CONCURRENCY = 8
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RolloutConfig:
     actions: Sequence[str]
     candidates: int
@@ -56,36 +72,134 @@ class RolloutConfig:
     seed: Optional[int]
     model_per_candidate: Optional[List[Dict[str, str]]] = None  # [{"action": "...", "model": "..."}, ...]
     critic_model: Optional[str] = None  # Model to use for critic scoring
+    parallelism: int = 1  # Observations rolled out concurrently (I/O-bound LLM calls)
+    candidate_parallelism: int = 1  # Candidates per observation rolled out concurrently
+    cache_dir: Optional[Path] = None  # Reuse tutor/critic results keyed by request hash when set
+    max_concurrency: Optional[int] = DEFAULT_MAX_CONCURRENCY  # In-flight tutor/critic call cap; None/0 = no cap
 
 
-def _read_observations(path: Path) -> List[Dict[str, Any]]:
-    content = path.read_text(encoding="utf-8").strip()
-    if not content:
-        return []
-    if content.lstrip().startswith("["):
-        data = json.loads(content)
-        if isinstance(data, list):
-            return [entry for entry in data if isinstance(entry, dict)]
-        raise ValueError("Observation JSON must be a list of objects")
-    observations: List[Dict[str, Any]] = []
-    for idx, line in enumerate(content.splitlines(), start=1):
-        if not line.strip():
-            continue
+@dataclass(frozen=True)
+class RolloutEntry:
+    """One observation source with its ``payload`` and ``observation`` validated as dicts once at intake."""
+
+    payload: Dict[str, Any]
+    observation: Dict[str, Any]
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "RolloutEntry":
+        return cls(payload=_safe_dict(raw.get("payload")), observation=_safe_dict(raw.get("observation")))
+
+
+# orjson decodes integers outside the 64-bit range as floats; such input uses stdlib json
+_WIDE_NUMBER = re.compile(rb"[0-9]{19}")
+
+
+class _NonFiniteFloat(float):
+    """inf/nan read by the stdlib fallback; tagged so orjson writes them as stdlib json would, not as null."""
+
+
+def _parse_float(text: str) -> float:
+    value = float(text)
+    return value if math.isfinite(value) else _NonFiniteFloat(value)
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, _NonFiniteFloat):
+        return orjson.Fragment(json.dumps(obj).encode("utf-8"))
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None and not _WIDE_NUMBER.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. 1e400 or NaN, which stdlib json accepts
+    return json.loads(data, parse_float=_parse_float, parse_constant=_NonFiniteFloat)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
         try:
-            obj = json.loads(line)
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Failed to parse JSON on line {idx}: {exc}") from exc
-        if isinstance(obj, dict):
-            observations.append(obj)
-    return observations
+            return orjson.dumps(obj, default=_orjson_default)
+        except TypeError:
+            pass  # integers beyond 64 bits
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _canonical(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, sort_keys=True, ensure_ascii=False).encode("utf-8")
 
 
-def _write_jsonl(path: Path, rows: Iterable[Dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        for row in rows:
-            handle.write(json.dumps(row, ensure_ascii=False))
-            handle.write("\n")
+def _cache_key(kind: str, request: Dict[str, Any]) -> str:
+    digest = hashlib.blake2b(_canonical(request), digest_size=20).hexdigest()
+    return f"{kind}-{digest}"
+
+
+def _entry_id(entry: Dict[str, Any]) -> str:
+    return hashlib.blake2b(_canonical(entry), digest_size=8).hexdigest()
+
+
+def _cached_call(
+    cache_dir: Optional[Path],
+    kind: str,
+    request: Dict[str, Any],
+    fn: Callable[[], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Return the cached result for ``request`` or compute it with ``fn`` and store it.
+
+    The key covers the request plus the active PROMPT_SET, so switching prompt
+    sets never serves stale results."""
+    if cache_dir is None:
+        return fn()
+    keyed = {"request": request, "prompt_set_env": os.getenv("PROMPT_SET")}
+    path = cache_dir / f"{_cache_key(kind, keyed)}.json"
+    try:
+        return _loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    result = fn()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(_dumps(result))
+    os.replace(tmp_path, path)
+    return result
+
+
+def _iter_observations(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield observation dicts from a JSONL file one line at a time.
+
+    JSON-array files are still parsed in one go; only JSONL is streamed."""
+    with path.open("rb") as handle:
+        head = handle.read(4096).lstrip()
+        while not head:
+            chunk = handle.read(4096)
+            if not chunk:
+                return
+            head = chunk.lstrip()
+        if head.startswith(b"["):
+            data = _loads(head + handle.read())
+            if not isinstance(data, list):
+                raise ValueError("Observation JSON must be a list of objects")
+            for entry in data:
+                if isinstance(entry, dict):
+                    yield entry
+            return
+        handle.seek(0)
+        for idx, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                obj = _loads(line)
+            except ValueError as exc:
+                raise ValueError(f"Failed to parse JSON on line {idx}: {exc}") from exc
+            if isinstance(obj, dict):
+                yield obj
 
 
 def _as_list(value: Any) -> List[Any]:
@@ -100,47 +214,74 @@ def _safe_dict(value: Any) -> Dict[str, Any]:
     return value if isinstance(value, dict) else {}
 
 
-def _ensure_observation(
-    entry: Dict[str, Any],
-    base_observation: Dict[str, Any],
-    *,
-    action_type: str,
-    candidate_index: int,
-    response_metadata: Dict[str, Any],
-    override_applied: bool = False,
-    override_type: Optional[str] = None,
-) -> Dict[str, Any]:
-    obs = copy.deepcopy(base_observation) if base_observation else {}
-    metadata = obs.setdefault("metadata", {})
-    metadata.setdefault("version", 1)
-
-    payload = _safe_dict(entry.get("payload"))
-    user = obs.setdefault("user", {})
-    user.setdefault("message", payload.get("message", ""))
-    user.setdefault("user_id", payload.get("user_id", "mock-user"))
-    user.setdefault("target_concepts", _as_list(payload.get("target_concepts")))
-
-    classifier = obs.setdefault("classifier", {})
-    classifier.setdefault("intent", "question")
-    classifier.setdefault("affect", "confused")
-    classifier.setdefault("concept", user.get("target_concepts", ["concept"])[0] if user.get("target_concepts") else "")
-    classifier.setdefault("confidence", 0.5)
-    classifier.setdefault("needs_escalation", False)
-
-    tutor = obs.setdefault("tutor", {})
-    focus_concept = tutor.setdefault("focus_concept", classifier.get("concept", "")) or classifier.get("concept", "")
-    tutor.setdefault("concept_level", "beginner")
-    tutor.setdefault("inference_concept", focus_concept)
-    tutor.setdefault("learning_path", user.get("target_concepts", [focus_concept]))
-    tutor.setdefault("target_concepts", user.get("target_concepts", [focus_concept]))
-    tutor.setdefault("mastery_snapshot", {"mastery": 0.2, "attempts": 0})
+def _shallow_observation(base_observation: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an observation one level deep so _ensure_observation can fill it in.
+
+    Only top-level sections and ``retrieval.chunks`` are mutated there, so
+    deeper values are shared with ``base_observation`` rather than cloned."""
+    obs = {key: (dict(value) if isinstance(value, dict) else value) for key, value in base_observation.items()}
+    retrieval = obs.get("retrieval")
+    if isinstance(retrieval, dict) and isinstance(retrieval.get("chunks"), list):
+        retrieval["chunks"] = list(retrieval["chunks"])
+    return obs
+
+
+def _with_defaults(obs: Dict[str, Any], section: str, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill ``obs[section]`` from ``defaults`` with setdefault semantics in a single pass.
+
+    A missing or empty section takes ``defaults`` as-is; otherwise only absent
+    keys are added, after the existing ones."""
+    current = obs.get(section)
+    if not current:
+        obs[section] = defaults
+        return defaults
+    for key, value in defaults.items():
+        if key not in current:
+            current[key] = value
+    return current
+
+
+def _build_base_observation(entry: RolloutEntry, base_observation: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill the candidate-independent observation sections from ``entry``.
+
+    Build once per observation source and hand the result to
+    :func:`_apply_candidate_fields` for each candidate."""
+    obs = _shallow_observation(base_observation) if base_observation else {}
+    _with_defaults(obs, "metadata", {"version": 1})
+
+    payload = entry.payload
+    user = _with_defaults(obs, "user", {
+        "message": payload.get("message", ""),
+        "user_id": payload.get("user_id", "mock-user"),
+        "target_concepts": _as_list(payload.get("target_concepts")),
+    })
+    target_concepts = user.get("target_concepts")
+
+    classifier = _with_defaults(obs, "classifier", {
+        "intent": "question",
+        "affect": "confused",
+        "concept": target_concepts[0] if target_concepts else "",
+        "confidence": 0.5,
+        "needs_escalation": False,
+    })
+
+    tutor = obs.get("tutor") or {}
+    concept = classifier.get("concept", "")
+    focus_concept = tutor.get("focus_concept", concept) or concept
+    _with_defaults(obs, "tutor", {
+        "focus_concept": concept,
+        "concept_level": "beginner",
+        "inference_concept": focus_concept,
+        "learning_path": user.get("target_concepts", [focus_concept]),
+        "target_concepts": user.get("target_concepts", [focus_concept]),
+        "mastery_snapshot": {"mastery": 0.2, "attempts": 0},
+    })
 
     retrieval = obs.setdefault("retrieval", {})
     chunk_ids = _as_list(retrieval.get("chunk_ids"))
     if not chunk_ids:
         chunk_ids = ["chunk-mock-1"]
     retrieval["chunk_ids"] = chunk_ids
-    retrieval.setdefault("source_chunk_ids", response_metadata.get("source_chunk_ids", chunk_ids))
     retrieval.setdefault("pedagogy_roles", ["definition"])
     chunks = retrieval.setdefault("chunks", [])
     if not chunks:
@@ -152,17 +293,45 @@ def _ensure_observation(
             "page_number": 1,
         })
 
-    policy = obs.setdefault("policy", {})
-    policy.setdefault("cold_start", False)
-    policy.setdefault("consecutive_explains", 0)
-    policy.setdefault("focus_concept", focus_concept)
+    _with_defaults(obs, "policy", {
+        "cold_start": False,
+        "consecutive_explains": 0,
+        "focus_concept": focus_concept,
+    })
+    return obs
+
 
-    session = obs.setdefault("session", {})
+def _apply_candidate_fields(
+    base: Dict[str, Any],
+    entry: RolloutEntry,
+    *,
+    action_type: str,
+    candidate_index: int,
+    response_metadata: Dict[str, Any],
+    override_applied: bool = False,
+    override_type: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Copy ``base`` and fill the sections that vary per candidate (retrieval sources, session, action).
+
+    Sections not touched here are shared with ``base``."""
+    obs = dict(base)
+    payload = entry.payload
+    tutor = obs.get("tutor") or {}
+    focus_concept = tutor.get("focus_concept") or (obs.get("classifier") or {}).get("concept", "")
+
+    retrieval = dict(obs.get("retrieval") or {})
+    obs["retrieval"] = retrieval
+    chunk_ids = retrieval.get("chunk_ids") or ["chunk-mock-1"]
+    retrieval.setdefault("source_chunk_ids", response_metadata.get("source_chunk_ids", chunk_ids))
+
+    session = dict(obs.get("session") or {})
+    obs["session"] = session
     session.setdefault("session_id", payload.get("session_id", f"mock-session-{candidate_index}"))
     session.setdefault("turn_index", candidate_index)
     session.setdefault("resource_id", payload.get("resource_id"))
 
-    action = obs.setdefault("action", {})
+    action = dict(obs.get("action") or {})
+    obs["action"] = action
     # Respect existing action fields from agent; only set when missing
     action.setdefault("type", action_type)
     action.setdefault("cold_start", False)
@@ -179,26 +348,50 @@ def _ensure_observation(
     return obs
 
 
+def _ensure_observation(
+    entry: RolloutEntry,
+    base_observation: Dict[str, Any],
+    *,
+    action_type: str,
+    candidate_index: int,
+    response_metadata: Dict[str, Any],
+    override_applied: bool = False,
+    override_type: Optional[str] = None,
+) -> Dict[str, Any]:
+    return _apply_candidate_fields(
+        _build_base_observation(entry, base_observation),
+        entry,
+        action_type=action_type,
+        candidate_index=candidate_index,
+        response_metadata=response_metadata,
+        override_applied=override_applied,
+        override_type=override_type,
+    )
+
+
 def _mock_tutor_turn(
-    entry: Dict[str, Any],
+    entry: RolloutEntry,
     *,
     action_type: str,
     candidate_index: int,
-    rng: random.Random,
+    draw: float,
+    prepared_observation: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    payload = _safe_dict(entry.get("payload"))
-    base_observation = _safe_dict(entry.get("observation"))
+    payload = entry.payload
+    base_observation = entry.observation
+    if prepared_observation is None:
+        prepared_observation = _build_base_observation(entry, base_observation)
     message = payload.get("message") or base_observation.get("user", {}).get("message") or "Review the concept."
     focus = base_observation.get("tutor", {}).get("focus_concept") or payload.get("focus_concept") or "concept"
     snippet = base_observation.get("retrieval", {}).get("chunks", [{}])[0].get("snippet") or message
 
     response_text = f"[{action_type.upper()}] {focus}: {snippet[:120]}"
-    confidence = round(0.55 + 0.1 * rng.random(), 4)
+    confidence = round(0.55 + 0.1 * draw, 4)
     source_chunk_ids = base_observation.get("retrieval", {}).get("chunk_ids") or [f"chunk-{candidate_index+1}"]
 
-    observation = _ensure_observation(
+    observation = _apply_candidate_fields(
+        prepared_observation,
         entry,
-        base_observation,
         action_type=action_type,
         candidate_index=candidate_index,
         response_metadata={"source_chunk_ids": source_chunk_ids, "confidence": confidence},
@@ -220,7 +413,8 @@ def _call_tutor_agent(
     action_type: str,
     model_hint: Optional[str] = None,
 ) -> Dict[str, Any]:
-    keyed_payload = copy.deepcopy(payload)
+    # Only top-level keys are set/popped below, so a shallow copy is enough
+    keyed_payload = dict(payload)
     keyed_payload["emit_state"] = True
     
     # Only add action_override if action_type is not "auto"
@@ -246,13 +440,8 @@ def _call_tutor_agent(
 
     progress = result.get("progress")
     if progress is not None:
-        try:
-            obs_copy = copy.deepcopy(observation)
-            obs_copy["progress"] = progress
-            observation = obs_copy
-        except Exception:
-            # If anything goes wrong, fall back to the original observation
-            pass
+        # Downstream code only copies and fills sections, so a shallow spread suffices
+        observation = {**observation, "progress": progress}
 
     return {
         "response": result.get("response", ""),
@@ -263,21 +452,13 @@ def _call_tutor_agent(
     }
 
 
-def _prepare_candidates(
-    entry: Dict[str, Any],
-    *,
-    config: RolloutConfig,
-    rng: random.Random,
-    validator_config: ValidatorConfig,
-    reward_weights: RewardWeights,
-) -> Dict[str, Any]:
-    payload = _safe_dict(entry.get("payload"))
-    base_observation = _safe_dict(entry.get("observation"))
-    candidates: List[Dict[str, Any]] = []
-
+def _candidate_plan(config: RolloutConfig) -> List[Tuple[int, str, Optional[str]]]:
+    plan: List[Tuple[int, str, Optional[str]]] = []
+    actions = tuple(config.actions)
+    n_actions = len(actions)
     for idx in range(config.candidates):
-        action_type = config.actions[idx % len(config.actions)]
-        
+        action_type = actions[idx % n_actions]
+
         # Get model from model_per_candidate if provided
         model_hint = None
         if config.model_per_candidate and idx < len(config.model_per_candidate):
@@ -286,23 +467,95 @@ def _prepare_candidates(
             candidate_action = config.model_per_candidate[idx].get("action")
             if candidate_action:
                 action_type = candidate_action
-        
-        if config.mock_mode:
-            tutor_result = _mock_tutor_turn(entry, action_type=action_type, candidate_index=idx, rng=rng)
-        else:
-            if not payload:
-                raise ValueError("Non-mock mode requires 'payload' field per observation")
-            tutor_result = _call_tutor_agent(payload, action_type=action_type, model_hint=model_hint)
-        
+        plan.append((idx, action_type, model_hint))
+    return plan
+
+
+@functools.lru_cache(maxsize=None)
+def _llm_gate(limit: Optional[int]) -> ContextManager[Any]:
+    """Bound in-flight tutor/critic calls across every rollout worker (no bound when ``limit`` is falsy)."""
+    if not limit or limit < 1:
+        return contextlib.nullcontext()
+    return threading.BoundedSemaphore(limit)
+
+
+def _fan_out(
+    fn: Callable[..., Any],
+    items: Sequence[Tuple[Any, ...]],
+    executor: Optional[ThreadPoolExecutor],
+) -> List[Any]:
+    """Run ``fn(*item)`` for each item on ``executor`` (inline without one); results keep item order."""
+    if executor is None or len(items) <= 1:
+        return [fn(*item) for item in items]
+    futures = [executor.submit(fn, *item) for item in items]
+    return [future.result() for future in futures]
+
+
+def _gated(gate: ContextManager[Any], fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    with gate:
+        return fn(*args, **kwargs)
+
+
+def _mock_draws(seed: Optional[int], count: int) -> List[float]:
+    """Draw every mock confidence for one observation up front (same stream as successive rng.random() calls)."""
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(count)]
+
+
+def _prepare_candidates(
+    entry: RolloutEntry,
+    *,
+    config: RolloutConfig,
+    plan: Sequence[Tuple[int, str, Optional[str]]],
+    mock_draws: Sequence[float] = (),
+    validator_config: ValidatorConfig,
+    reward_weights: RewardWeights,
+    candidate_pool: Optional[ThreadPoolExecutor] = None,
+) -> Dict[str, Any]:
+    payload = entry.payload
+    base_observation = entry.observation
+    llm_gate = _llm_gate(config.max_concurrency)
+
+    # Wave 1: tutor responses. Candidates are independent rollouts, so real
+    # tutor calls fan out; mock turns are cheap and read their pre-drawn floats.
+    if config.mock_mode:
+        prepared_observation = _build_base_observation(entry, base_observation)
+        tutor_results = [
+            _mock_tutor_turn(
+                entry,
+                action_type=action_type,
+                candidate_index=idx,
+                draw=mock_draws[idx],
+                prepared_observation=prepared_observation,
+            )
+            for idx, action_type, _ in plan
+        ]
+    else:
+        if not payload:
+            raise ValueError("Non-mock mode requires 'payload' field per observation")
+        def tutor_call(action_type: str, model_hint: Optional[str]) -> Dict[str, Any]:
+            return _cached_call(
+                config.cache_dir,
+                "tutor",
+                {"payload": payload, "action_type": action_type, "model_hint": model_hint},
+                lambda: _gated(llm_gate, _call_tutor_agent, payload, action_type=action_type, model_hint=model_hint),
+            )
+
+        tutor_results = _fan_out(
+            tutor_call,
+            [(action_type, model_hint) for _, action_type, model_hint in plan],
+            candidate_pool,
+        )
+
+    # Wave 2: candidate observations, then one batched validator pass over all of them
+    def build_candidate(idx: int, action_type: str, tutor_result: Dict[str, Any]) -> Dict[str, Any]:
         # Get the actual action type from the result (especially important for "auto")
         actual_action_type = tutor_result.get("action_type", action_type)
 
         # Determine whether an override was applied for this candidate
         is_override = bool(config.mock_mode or (action_type != "auto"))
 
-        observation = _ensure_observation(
-            entry,
-            tutor_result.get("observation") or base_observation,
+        candidate_fields = dict(
             action_type=actual_action_type,
             candidate_index=idx,
             response_metadata={
@@ -312,28 +565,18 @@ def _prepare_candidates(
             override_applied=is_override,
             override_type=(None if not is_override else action_type),
         )
+        tutor_observation = tutor_result.get("observation")
+        if config.mock_mode and tutor_observation:
+            # Mock observations were already built from the shared per-entry base
+            observation = _apply_candidate_fields(tutor_observation, entry, **candidate_fields)
+        else:
+            observation = _ensure_observation(entry, tutor_observation or base_observation, **candidate_fields)
 
-        reward_payload = score_response(
-            observation,
-            tutor_result.get("response", ""),
-            {"source_chunk_ids": tutor_result.get("source_chunk_ids", [])},
-            weights=reward_weights,
-            config=validator_config,
-        )
-
-        critic_payload = score_with_critic(
-            observation,
-            tutor_result.get("response", ""),
-            {"source_chunk_ids": tutor_result.get("source_chunk_ids", []), "confidence": tutor_result.get("confidence", 0.0)},
-            prompt_set=config.prompt_set,
-            model_hint=config.critic_model,
-        )
-
-        candidate = {
+        return {
             "action": observation.get("action", {"type": action_type}),
             "response": tutor_result.get("response", ""),
-            "reward": reward_payload,
-            "critic": critic_payload,
+            "reward": None,
+            "critic": None,
             "observation": observation,
             "meta": {
                 "candidate_index": idx,
@@ -342,19 +585,56 @@ def _prepare_candidates(
                 "confidence": tutor_result.get("confidence", None),
             },
         }
-        candidates.append(candidate)
 
-    preference_payload = preference_with_critic(
+    candidates: List[Dict[str, Any]] = [
+        build_candidate(idx, action_type, tutor_result)
+        for (idx, action_type, _), tutor_result in zip(plan, tutor_results)
+    ]
+    rewards = batch_score_response(
+        [c["observation"] for c in candidates],
+        [c["response"] for c in candidates],
+        [{"source_chunk_ids": c["meta"]["source_chunk_ids"]} for c in candidates],
+        weights=reward_weights,
+        config=validator_config,
+    )
+    for candidate, reward_payload in zip(candidates, rewards):
+        candidate["reward"] = reward_payload
+
+    # Wave 3: one judge call scores every candidate and picks the preferred one
+    critic_candidates = [{
+        "observation": c.get("observation"),
+        "action": c.get("action"),
+        "response": c.get("response"),
+        "reward": c.get("reward"),
+        "response_metadata": {
+            "source_chunk_ids": c["meta"].get("source_chunk_ids", []),
+            "confidence": c["meta"].get("confidence") or 0.0,
+        },
+    } for c in candidates]
+    critic_call = lambda: _gated(  # noqa: E731
+        llm_gate,
+        batch_score_with_critic,
         candidates[0]["observation"],
-        [{
-            "action": c.get("action"),
-            "response": c.get("response"),
-            "reward": c.get("reward"),
-            "critic": c.get("critic"),
-        } for c in candidates],
+        critic_candidates,
         prompt_set=config.prompt_set,
         model_hint=config.critic_model,
     )
+    if config.mock_mode:
+        judged = critic_call()
+    else:
+        judged = _cached_call(
+            config.cache_dir,
+            "critic",
+            {
+                "candidates": critic_candidates,
+                "prompt_set": config.prompt_set,
+                "model_hint": config.critic_model,
+            },
+            critic_call,
+        )
+    for candidate, critic_payload in zip(candidates, judged["critics"]):
+        candidate["critic"] = critic_payload
+    preference_payload = judged["preference"]
 
     return {
         "candidates": candidates,
@@ -362,58 +642,196 @@ def _prepare_candidates(
     }
 
 
-def run_rollout(
-    observations: List[Dict[str, Any]],
+def _map_ordered(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: int,
+) -> Iterator[Any]:
+    """Apply ``fn(item)`` with up to ``workers`` threads, yielding results in input order.
+
+    At most ``2 * workers`` items are in flight so the input is still consumed lazily."""
+    if workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future] = deque()
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _iter_prepared(
+    observations: Iterable[Dict[str, Any]],
     *,
     config: RolloutConfig,
-) -> Dict[str, List[Dict[str, Any]]]:
-    rng = random.Random(config.seed)
+    finalize: Callable[[Dict[str, Any]], List[Tuple[str, Any]]],
+    processed: Optional[Set[str]] = None,
+) -> Iterator[Tuple[Optional[str], List[Tuple[str, Any]]]]:
+    """Roll out each observation and yield ``(entry_id, rows)`` with the rows produced by ``finalize``.
+
+    When ``processed`` is given, entries are identified by :func:`_entry_id` and
+    those already in the set are skipped; otherwise ``entry_id`` is ``None``.
+    With ``config.parallelism > 1`` observations are prepared (and finalized) on a
+    thread pool; output order still follows input order. Real tutor calls fan
+    out on one candidate pool owned by this run and shut down with it."""
     validator_config = ValidatorConfig.from_env()
     reward_weights = RewardWeights.from_env()
-
-    sft_records: List[Dict[str, Any]] = []
-    preference_records: List[Dict[str, Any]] = []
-
-    for entry in observations:
-        prepared = _prepare_candidates(
-            entry,
+    # The config is frozen, so the candidate plan is the same for every entry
+    plan = _candidate_plan(config)
+
+    def pending() -> Iterator[Tuple[int, Optional[str], Dict[str, Any]]]:
+        # Skipped entries keep their position so per-entry seeds match a full run
+        for entry_idx, entry in enumerate(observations):
+            entry_id = None if processed is None else _entry_id(entry)
+            if entry_id is None or entry_id not in processed:
+                yield entry_idx, entry_id, entry
+
+    def prepare(item: Tuple[int, Optional[str], Dict[str, Any]]) -> Tuple[Optional[str], List[Tuple[str, Any]]]:
+        entry_idx, entry_id, entry = item
+        # Per-entry seeds keep mock output deterministic regardless of scheduling
+        mock_draws: Sequence[float] = ()
+        if config.mock_mode:
+            mock_draws = _mock_draws(None if config.seed is None else config.seed + entry_idx, config.candidates)
+        return entry_id, finalize(_prepare_candidates(
+            RolloutEntry.from_raw(entry),
             config=config,
-            rng=rng,
+            plan=plan,
+            mock_draws=mock_draws,
             validator_config=validator_config,
             reward_weights=reward_weights,
+            candidate_pool=candidate_pool,
+        ))
+
+    candidate_workers = max(1, config.candidate_parallelism)
+    # Kept separate from the observation pool so nested submissions cannot
+    # starve each other; sized so concurrent observations do not queue
+    pool_context: ContextManager[Optional[ThreadPoolExecutor]] = (
+        ThreadPoolExecutor(
+            max_workers=candidate_workers * max(1, config.parallelism),
+            thread_name_prefix="rollout-candidate",
         )
-        candidates = prepared["candidates"]
-        preference = prepared["preference"]
-
-        for candidate in candidates:
-            record = {
-                "observation": candidate.get("observation"),
-                "action": candidate.get("action"),
-                "response": candidate.get("response"),
-                "reward": candidate.get("reward"),
-                "critic": candidate.get("critic"),
-                "meta": candidate.get("meta", {}),
-            }
-            sft_records.append(record)
-
-        preference_records.append(
-            {
-                "observation": candidates[0].get("observation"),
-                "candidates": [
-                    {
-                        "action": candidate.get("action"),
-                        "response": candidate.get("response"),
-                        "reward": candidate.get("reward"),
-                        "critic": candidate.get("critic"),
-                        "meta": candidate.get("meta", {}),
-                    }
-                    for candidate in candidates
-                ],
-                "preference": preference,
-            }
-        )
+        if candidate_workers > 1 and not config.mock_mode
+        else contextlib.nullcontext()
+    )
+    with pool_context as candidate_pool:
+        yield from _map_ordered(prepare, pending(), max(1, config.parallelism))
 
-    return {"sft": sft_records, "prefs": preference_records}
+
+def _candidate_record(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "action": candidate.get("action"),
+        "response": candidate.get("response"),
+        "reward": candidate.get("reward"),
+        "critic": candidate.get("critic"),
+        "meta": candidate.get("meta", {}),
+    }
+
+
+def _records(prepared: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    candidates = prepared["candidates"]
+    rows: List[Tuple[str, Dict[str, Any]]] = [
+        ("sft", {"observation": candidate.get("observation"), **_candidate_record(candidate)})
+        for candidate in candidates
+    ]
+    rows.append(("prefs", {
+        "observation": candidates[0].get("observation"),
+        "candidates": [_candidate_record(candidate) for candidate in candidates],
+        "preference": prepared["preference"],
+    }))
+    return rows
+
+
+def _encoded_rows(prepared: Dict[str, Any]) -> List[Tuple[str, bytes]]:
+    """Serialize the rows of :func:`_records` as JSONL lines, encoding each shared part once.
+
+    Every candidate body appears in its SFT row and in the preference row, and the
+    first observation in both as well, so rows are spliced from pre-encoded pieces."""
+    candidates = prepared["candidates"]
+    bodies = [_dumps(_candidate_record(candidate)) for candidate in candidates]
+    observations = [_dumps(candidate.get("observation")) for candidate in candidates]
+    rows: List[Tuple[str, bytes]] = [
+        ("sft", b'{"observation":' + observation + b"," + body[1:] + b"\n")
+        for observation, body in zip(observations, bodies)
+    ]
+    rows.append((
+        "prefs",
+        b'{"observation":' + observations[0]
+        + b',"candidates":[' + b",".join(bodies)
+        + b'],"preference":' + _dumps(prepared["preference"]) + b"}\n",
+    ))
+    return rows
+
+
+def iter_rollout(
+    observations: Iterable[Dict[str, Any]],
+    *,
+    config: RolloutConfig,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ``("sft", record)`` and ``("prefs", record)`` pairs as each observation is rolled out."""
+    for _, rows in _iter_prepared(observations, config=config, finalize=_records):
+        yield from rows
+
+
+def iter_rollout_lines(
+    observations: Iterable[Dict[str, Any]],
+    *,
+    config: RolloutConfig,
+    processed: Optional[Set[str]] = None,
+) -> Iterator[Tuple[Optional[str], List[Tuple[str, bytes]]]]:
+    """Yield ``(entry_id, [(kind, line), ...])`` per observation with JSONL lines encoded on the worker threads.
+
+    Entries whose id is in ``processed`` are skipped (see :func:`_iter_prepared`)."""
+    return _iter_prepared(observations, config=config, finalize=_encoded_rows, processed=processed)
+
+
+def _restore_checkpoint(manifest_path: Path, outputs: Sequence[Path]) -> Set[str]:
+    """Load processed entry ids and roll ``outputs`` back to the last checkpoint.
+
+    Each manifest line is ``<entry_id>\t<end offset per output>...`` and is written
+    only after that entry's rows are flushed, so truncating to the recorded offsets
+    drops rows from an entry that was interrupted mid-write."""
+    processed: Set[str] = set()
+    offsets = [0] * len(outputs)
+    valid_end = 0
+    if manifest_path.exists():
+        data = manifest_path.read_bytes()
+        for line in data.splitlines(keepends=True):
+            fields = line.rstrip(b"\n").decode("utf-8", "replace").split("\t")
+            if not line.endswith(b"\n") or len(fields) != len(outputs) + 1:
+                break
+            try:
+                line_offsets = [int(value) for value in fields[1:]]
+            except ValueError:
+                break
+            processed.add(fields[0])
+            offsets = line_offsets
+            valid_end += len(line)
+        if valid_end < len(data):
+            with manifest_path.open("r+b") as handle:
+                handle.truncate(valid_end)
+    for path, offset in zip(outputs, offsets):
+        size = path.stat().st_size if path.exists() else 0
+        if size < offset:
+            raise RuntimeError(f"{path} is shorter than its checkpoint in {manifest_path}; rerun without --resume")
+        if size > offset:
+            with path.open("r+b") as handle:
+                handle.truncate(offset)
+    return processed
+
+
+def run_rollout(
+    observations: Iterable[Dict[str, Any]],
+    *,
+    config: RolloutConfig,
+) -> Dict[str, List[Dict[str, Any]]]:
+    results: Dict[str, List[Dict[str, Any]]] = {"sft": [], "prefs": []}
+    for kind, record in iter_rollout(observations, config=config):
+        results[kind].append(record)
+    return results
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -430,6 +848,44 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument("--prompt-set", type=str, default=None, help="Optional prompt set tag (sets PROMPT_SET)")
     parser.add_argument("--mock", action="store_true", help="Use deterministic mock tutor responses (no DB required)")
     parser.add_argument("--seed", type=int, default=None, help="Random seed for deterministic mock mode")
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=min(32, (os.cpu_count() or 1) * 4),
+        help="Observations to roll out concurrently (tutor/critic calls are I/O-bound)",
+    )
+    parser.add_argument(
+        "--candidate-parallelism",
+        type=int,
+        default=4,
+        help="Candidates per observation to roll out concurrently",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=(
+            "Cap on in-flight tutor/critic calls across all workers, each holding a DB connection "
+            f"(default: {DEFAULT_MAX_CONCURRENCY}; 0 disables the cap)"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Append to existing outputs, skipping observations listed in <out-dir>/{MANIFEST_FILE}",
+    )
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Reuse tutor/critic results for identical requests (non-mock mode only)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path.home() / ".cache" / "tutor_rollout",
+        help="Directory for the --cache result store",
+    )
     return parser.parse_args(argv)
 
 
@@ -446,29 +902,55 @@ def main(argv: Optional[List[str]] = None) -> int:
     if args.mock:
         os.environ.setdefault("USE_LLM_MOCK", "1")
 
-    observations = _read_observations(args.observations)
-    if not observations:
+    observations = _iter_observations(args.observations)
+    first = next(observations, None)
+    if first is None:
         logging.warning("No observations found at %s", args.observations)
         return 0
 
     rollout_config = RolloutConfig(
-        actions=actions,
+        actions=tuple(actions),
         candidates=max(1, args.candidates),
         prompt_set=args.prompt_set,
         mock_mode=args.mock,
         seed=args.seed,
+        parallelism=max(1, args.parallelism),
+        candidate_parallelism=max(1, args.candidate_parallelism),
+        cache_dir=args.cache_dir if args.cache else None,
+        max_concurrency=args.max_concurrency,
     )
 
-    results = run_rollout(observations, config=rollout_config)
-
     out_dir = args.out_dir.resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
     sft_path = out_dir / "sft.jsonl"
     prefs_path = out_dir / "prefs.jsonl"
-    _write_jsonl(sft_path, results["sft"])
-    _write_jsonl(prefs_path, results["prefs"])
-
-    logging.info("Wrote %s (%d rows)", sft_path, len(results["sft"]))
-    logging.info("Wrote %s (%d rows)", prefs_path, len(results["prefs"]))
+    manifest_path = out_dir / MANIFEST_FILE
+    processed: Set[str] = set()
+    if args.resume:
+        processed = _restore_checkpoint(manifest_path, [sft_path, prefs_path])
+        if processed:
+            logging.info("Resuming: %d observations already processed", len(processed))
+    mode = "ab" if args.resume else "wb"
+    counts = {"sft": 0, "prefs": 0}
+    with sft_path.open(mode) as sft_handle, prefs_path.open(mode) as prefs_handle, \
+            manifest_path.open(mode) as manifest_handle:
+        handles = {"sft": sft_handle, "prefs": prefs_handle}
+        lines_by_entry = iter_rollout_lines(
+            itertools.chain([first], observations),
+            config=rollout_config,
+            processed=processed,
+        )
+        for entry_id, lines in lines_by_entry:
+            for kind, line in lines:
+                handles[kind].write(line)
+                counts[kind] += 1
+            sft_handle.flush()
+            prefs_handle.flush()
+            manifest_handle.write(f"{entry_id}\t{sft_handle.tell()}\t{prefs_handle.tell()}\n".encode("utf-8"))
+            manifest_handle.flush()
+
+    logging.info("Wrote %s (%d rows)", sft_path, counts["sft"])
+    logging.info("Wrote %s (%d rows)", prefs_path, counts["prefs"])
     return 0
 
 
@@ -45,45 +45,61 @@ def validate_pedagogy_tags(sample_size: int = 10):
             print("PEDAGOGY ROLE TAGGING VALIDATION REPORT")
             print("="*80 + "\n")
             
-            # 1. Coverage statistics
+            # Coverage, role distribution, structure and untagged counts in one round trip
             cur.execute("""
+                WITH totals AS (
+                    SELECT 
+                        COUNT(*) as total_chunks,
+                        COUNT(tags->>'pedagogy_role') as tagged_chunks,
+                        COUNT(tags) as tags_total,
+                        COUNT(CASE WHEN jsonb_typeof(tags) = 'object' THEN 1 END) as valid_json,
+                        COUNT(CASE WHEN tags = '{}'::jsonb THEN 1 END) as empty_tags,
+                        COUNT(CASE WHEN tags IS NULL OR tags = '{}'::jsonb OR tags->>'pedagogy_role' IS NULL THEN 1 END) as untagged
+                    FROM chunk
+                ),
+                roles AS (
+                    SELECT 
+                        tags->>'pedagogy_role' as role,
+                        COUNT(*) as count
+                    FROM chunk
+                    WHERE tags->>'pedagogy_role' IS NOT NULL
+                    GROUP BY 1
+                )
                 SELECT 
-                    COUNT(*) as total_chunks,
-                    COUNT(CASE WHEN tags->>'pedagogy_role' IS NOT NULL THEN 1 END) as tagged_chunks,
-                    ROUND(100.0 * COUNT(CASE WHEN tags->>'pedagogy_role' IS NOT NULL THEN 1 END) / NULLIF(COUNT(*), 0), 2) as coverage_pct
-                FROM chunk
+                    totals.*,
+                    COALESCE(
+                        (SELECT jsonb_agg(jsonb_build_object('role', role, 'count', count) ORDER BY count DESC) FROM roles),
+                        '[]'::jsonb
+                    ) as roles
+                FROM totals
             """)
-            coverage = cur.fetchone()
+            report = cur.fetchone()
+            
+            # 1. Coverage statistics
+            total_chunks = report['total_chunks']
+            tagged_chunks = report['tagged_chunks']
+            coverage_pct = round(100.0 * tagged_chunks / total_chunks, 2) if total_chunks else 0.0
             
             print("=== Coverage Statistics ===")
-            print(f"Total chunks: {coverage['total_chunks']:,}")
-            print(f"Tagged chunks: {coverage['tagged_chunks']:,}")
-            print(f"Coverage: {coverage['coverage_pct']}%")
+            print(f"Total chunks: {total_chunks:,}")
+            print(f"Tagged chunks: {tagged_chunks:,}")
+            print(f"Coverage: {coverage_pct}%")
             
-            if coverage['coverage_pct'] < 95:
+            if coverage_pct < 95:
                 print(f"⚠️  WARNING: Coverage is below 95% target")
             else:
                 print(f"✓ Coverage meets 95% target")
             print()
             
             # 2. Role distribution
-            cur.execute("""
-                SELECT 
-                    tags->>'pedagogy_role' as role,
-                    COUNT(*) as count,
-                    ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 2) as percentage
-                FROM chunk
-                WHERE tags->>'pedagogy_role' IS NOT NULL
-                GROUP BY tags->>'pedagogy_role'
-                ORDER BY count DESC
-            """)
-            
             print("=== Role Distribution ===")
             print(f"{'Role':<20} {'Count':>10} {'Percentage':>12}")
             print("-" * 44)
             
-            roles = cur.fetchall()
+            roles = report['roles'] or []
+            role_total = sum(r['count'] for r in roles)
             for row in roles:
+                row['percentage'] = round(100.0 * row['count'] / role_total, 2) if role_total else 0.0
                 print(f"{row['role']:<20} {row['count']:>10,} {row['percentage']:>11.1f}%")
             
             # Check for imbalance
@@ -96,15 +112,11 @@ def validate_pedagogy_tags(sample_size: int = 10):
             print()
             
             # 3. Tags structure validation
-            cur.execute("""
-                SELECT 
-                    COUNT(*) as total,
-                    COUNT(CASE WHEN jsonb_typeof(tags) = 'object' THEN 1 END) as valid_json,
-                    COUNT(CASE WHEN tags = '{}'::jsonb THEN 1 END) as empty_tags
-                FROM chunk
-                WHERE tags IS NOT NULL
-            """)
-            structure = cur.fetchone()
+            structure = {
+                'total': report['tags_total'],
+                'valid_json': report['valid_json'],
+                'empty_tags': report['empty_tags'],
+            }
             
             print("=== Tags Structure ===")
             print(f"Total chunks with tags: {structure['total']:,}")
@@ -117,52 +129,55 @@ def validate_pedagogy_tags(sample_size: int = 10):
                 print(f"⚠️  WARNING: {structure['total'] - structure['valid_json']} chunks have invalid tags")
             print()
             
-            # 4. Sample chunks for manual review
-            cur.execute(f"""
-                SELECT 
-                    tags->>'pedagogy_role' as role,
-                    LEFT(full_text, 200) as snippet,
-                    page_number,
-                    section_title
-                FROM chunk
-                WHERE tags->>'pedagogy_role' IS NOT NULL
-                ORDER BY RANDOM()
-                LIMIT {sample_size}
-            """)
-            
+            # 4. Sample chunks for manual review. Pre-filter with random() to roughly
+            # 3x the sample size so only a handful of rows get sorted, instead of
+            # ORDER BY RANDOM() over every tagged chunk.
+            sample_fraction = min(1.0, 3.0 * sample_size / tagged_chunks) if tagged_chunks else 1.0
             print(f"=== Sample Tagged Chunks (for manual validation, n={sample_size}) ===")
-            samples = cur.fetchall()
-            for idx, row in enumerate(samples, 1):
-                print(f"\n--- Sample {idx} ---")
-                print(f"Role: {row['role']}")
-                print(f"Page: {row['page_number']}, Section: {row['section_title'] or 'N/A'}")
-                print(f"Text: {row['snippet']}...")
+            # Server-side cursors stream row listings in itersize batches instead of
+            # materialising the whole result client-side.
+            with conn.cursor(name="pedagogy_validate_sample", cursor_factory=RealDictCursor) as sample_cur:
+                sample_cur.itersize = 100
+                sample_cur.execute("""
+                    SELECT 
+                        tags->>'pedagogy_role' as role,
+                        LEFT(full_text, 200) as snippet,
+                        page_number,
+                        section_title
+                    FROM chunk
+                    WHERE tags->>'pedagogy_role' IS NOT NULL
+                      AND random() < %s
+                    ORDER BY RANDOM()
+                    LIMIT %s
+                """, (sample_fraction, sample_size))
+                for idx, row in enumerate(sample_cur, 1):
+                    print(f"\n--- Sample {idx} ---")
+                    print(f"Role: {row['role']}")
+                    print(f"Page: {row['page_number']}, Section: {row['section_title'] or 'N/A'}")
+                    print(f"Text: {row['snippet']}...")
             print()
             
             # 5. Chunks without pedagogy_role (for investigation)
-            cur.execute("""
-                SELECT COUNT(*) as untagged
-                FROM chunk
-                WHERE tags IS NULL OR tags = '{}'::jsonb OR tags->>'pedagogy_role' IS NULL
-            """)
-            untagged = cur.fetchone()['untagged']
+            untagged = report['untagged']
             
             if untagged > 0:
                 print(f"=== Untagged Chunks ===")
                 print(f"Chunks without pedagogy_role: {untagged:,}")
                 
                 # Show a few examples
-                cur.execute("""
-                    SELECT id, LEFT(full_text, 100) as snippet, page_number
-                    FROM chunk
-                    WHERE tags IS NULL OR tags = '{}'::jsonb OR tags->>'pedagogy_role' IS NULL
-                    LIMIT 5
-                """)
                 print("\nExamples of untagged chunks:")
-                for row in cur.fetchall():
-                    print(f"  ID: {row['id']}, Page: {row['page_number']}")
-                    print(f"  Text: {row['snippet']}...")
-                    print()
+                with conn.cursor(name="pedagogy_validate_untagged", cursor_factory=RealDictCursor) as untagged_cur:
+                    untagged_cur.itersize = 100
+                    untagged_cur.execute("""
+                        SELECT id, LEFT(full_text, 100) as snippet, page_number
+                        FROM chunk
+                        WHERE tags IS NULL OR tags = '{}'::jsonb OR tags->>'pedagogy_role' IS NULL
+                        LIMIT 5
+                    """)
+                    for row in untagged_cur:
+                        print(f"  ID: {row['id']}, Page: {row['page_number']}")
+                        print(f"  Text: {row['snippet']}...")
+                        print()
             else:
                 print("✓ All chunks have pedagogy_role tags")
             
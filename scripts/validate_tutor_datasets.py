@@ -5,10 +5,11 @@ Usage examples:
 
     python scripts/validate_tutor_datasets.py --sft data/sft.jsonl --prefs data/prefs.jsonl
     python scripts/validate_tutor_datasets.py --sft data/sft.jsonl --redact out/redacted
+    python scripts/validate_tutor_datasets.py --sft data/sft.jsonl --jobs 8
 
 The script performs:
 - Pydantic validation against `backend.schemas.tutor_rl`
-- Optional JSON Schema validation if `jsonschema` is installed
+- Optional JSON Schema validation if `fastjsonschema` or `jsonschema` is installed
 - Sanity checks for reward totals, weight normalization, candidate counts
 - Optional redaction of sensitive identifiers when `--redact` is supplied
 """
@@ -16,37 +17,129 @@ The script performs:
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import json
 import math
+import mmap
+import os
+import re
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Ensure backend modules are importable when running as a script
 ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
+if "backend" not in sys.modules and str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+try:  # optional fast JSON codec; stdlib json is the fallback
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
 try:  # pragma: no cover - optional dependency
-    import jsonschema  # type: ignore
+    import fastjsonschema  # type: ignore
 except Exception:  # pragma: no cover
-    jsonschema = None  # type: ignore
+    fastjsonschema = None  # type: ignore
 
-from backend.schemas.tutor_rl import PreferenceRecord, SFTRecord
+jsonschema = None  # fallback validator; only imported when fastjsonschema is missing
+if fastjsonschema is None:  # pragma: no cover - optional dependency
+    try:
+        import jsonschema  # type: ignore
+    except Exception:  # pragma: no cover
+        jsonschema = None  # type: ignore
 
+from pydantic import TypeAdapter, ValidationError
+
+if TYPE_CHECKING:  # the backend model graph is imported on first validation, not for --help
+    from backend.schemas.tutor_rl import PreferenceRecord, SFTRecord
+
+SCHEMA_DIR = ROOT_DIR / "schemas" / "tutor_rl"
+SFT_SCHEMA_PATH = SCHEMA_DIR / "sft.schema.json"
+PREFS_SCHEMA_PATH = SCHEMA_DIR / "prefs.schema.json"
+_COUNT_BLOCK = 1 << 20  # bytes scanned per newline-count slice when splitting files
 
-def _load_jsonl(path: Path) -> Iterable[Tuple[int, dict]]:
-    with path.open("r", encoding="utf-8") as handle:
-        for idx, line in enumerate(handle, start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            try:
-                yield idx, json.loads(stripped)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"{path}: failed to parse JSON on line {idx}: {exc}") from exc
 
+# orjson decodes integers outside the 64-bit range as floats; such lines use stdlib json
+_WIDE_NUMBER = re.compile(rb"[0-9]{19}")
 
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None and not _WIDE_NUMBER.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. 1e400, which stdlib json (and pydantic) accept
+    return json.loads(data)
+
+
+def _iter_jsonl_lines(
+    path: Path,
+    start: int = 0,
+    end: Optional[int] = None,
+    first_line: int = 1,
+) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(line_number, raw_line)`` for the non-blank lines in bytes ``[start, end)`` of ``path``.
+
+    ``start`` must sit at the beginning of a line; ``first_line`` is its line number.
+    The file is memory-mapped with a sequential-access hint and newlines are located
+    with ``mmap.find`` (memchr), so no per-line ``readline`` or text decoding happens."""
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if start >= end:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            if hasattr(view, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                view.madvise(mmap.MADV_SEQUENTIAL)
+            find = view.find
+            idx = first_line
+            while start < end:
+                newline = find(b"\n", start, end)
+                if newline < 0:
+                    newline = end
+                line = view[start:newline]
+                start = newline + 1
+                if line.strip():
+                    yield idx, line
+                idx += 1
+
+
+def _parse_error(path: Path, idx: int, exc: Exception) -> ValueError:
+    return ValueError(f"{path}: failed to parse JSON on line {idx}: {exc}")
+
+
+def _is_json_error(exc: Exception) -> bool:
+    return isinstance(exc, ValidationError) and any(err.get("type") == "json_invalid" for err in exc.errors())
+
+
+def _split_ranges(path: Path, parts: int) -> List[Tuple[int, int, int]]:
+    """Split ``path`` into up to ``parts`` ``(start, end, first_line)`` byte ranges snapped to line starts."""
+    size = path.stat().st_size
+    if size == 0 or parts <= 1:
+        return [(0, size, 1)]
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        bounds = [0]
+        for part in range(1, parts):
+            newline = view.find(b"\n", max(bounds[-1], size * part // parts))
+            if newline == -1 or newline + 1 >= size:
+                break
+            bounds.append(newline + 1)
+        bounds.append(size)
+
+        ranges: List[Tuple[int, int, int]] = []
+        line = 1
+        for start, end in zip(bounds, bounds[1:]):
+            ranges.append((start, end, line))
+            for block in range(start, end, _COUNT_BLOCK):
+                line += view[block:min(end, block + _COUNT_BLOCK)].count(b"\n")
+    return ranges
+
+
+@functools.lru_cache(maxsize=None)
 def _load_schema(schema_path: Path) -> Optional[dict]:
     if not schema_path.exists():
         return None
@@ -57,115 +150,314 @@ def _load_schema(schema_path: Path) -> Optional[dict]:
         return None
 
 
-def _sum_close(values: Iterable[float], target: float, tolerance: float = 0.05) -> bool:
-    total = sum(values)
-    return math.isclose(total, target, rel_tol=tolerance, abs_tol=tolerance)
+@functools.lru_cache(maxsize=None)
+def _get_validator(schema_path: Path) -> Optional[Callable[[Any], Any]]:
+    """Return a compiled check for ``schema_path``, built once per process (None if unavailable).
 
+    The check raises on invalid input. ``fastjsonschema`` generates straight-line
+    Python for the schema and is preferred; ``jsonschema`` is the fallback."""
+    schema = _load_schema(schema_path)
+    if not schema:
+        return None
+    if fastjsonschema is not None:
+        # use_default=False: validation must not insert schema defaults into the payload
+        return fastjsonschema.compile(schema, use_default=False)  # type: ignore
+    if jsonschema is not None:
+        jsonschema.Draft202012Validator.check_schema(schema)  # type: ignore
+        return jsonschema.Draft202012Validator(schema, format_checker=None).validate  # type: ignore
+    return None
 
-def _redact_observation(observation: dict) -> None:
-    user = observation.get("user")
-    if isinstance(user, dict):
-        user.pop("user_id", None)
-    session = observation.get("session")
-    if isinstance(session, dict):
-        session.pop("session_id", None)
 
+WEIGHT_SUM_TOLERANCE = 0.05  # absolute slack allowed around 1.0 for normalized reward weights
 
-def _redact_record(record: dict) -> dict:
-    observation = record.get("observation")
-    if isinstance(observation, dict):
-        _redact_observation(observation)
-    return record
 
+def _sum_delta(values: Iterable[float], target: float) -> Tuple[float, float]:
+    """Return ``(total, |total - target|)`` from a single ``math.fsum`` pass."""
+    total = math.fsum(values)
+    return total, abs(total - target)
 
-def validate_sft(path: Path, *, redact_dir: Optional[Path] = None) -> List[str]:
-    schema_path = ROOT_DIR / "schemas" / "tutor_rl" / "sft.schema.json"
-    schema = _load_schema(schema_path)
-    validator = None
-    if jsonschema and schema:
-        validator = jsonschema.Draft202012Validator(schema)  # type: ignore
 
-    errors: List[str] = []
-    redacted_records: List[str] = []
+_REDACTED_KEYS = {"user": "user_id", "session": "session_id"}
+# Raw-line markers: a line containing none of these cannot hold a redacted key
+# (``\u`` covers keys spelled with JSON unicode escapes)
+_REDACTION_MARKERS = tuple(f'"{key}"'.encode("utf-8") for key in _REDACTED_KEYS.values()) + (b"\\u",)
 
-    for idx, payload in _load_jsonl(path):
-        try:
-            record = SFTRecord.model_validate(payload)
-        except Exception as exc:  # pragma: no cover - error path exercised in QA
-            errors.append(f"{path}:{idx} - pydantic validation failed: {exc}")
-            continue
 
-        if validator:
-            try:
-                validator.validate(payload)
-            except Exception as exc:  # pragma: no cover - optional
-                errors.append(f"{path}:{idx} - schema validation failed: {exc}")
-
-        reward = record.reward
-        if not _sum_close(reward.normalized_weights.values(), 1.0, tolerance=0.05):
-            errors.append(
-                f"{path}:{idx} - normalized weight sum {sum(reward.normalized_weights.values()):.3f} != 1.0"
-            )
-        if not (0.0 <= reward.total <= 1.0):
-            errors.append(f"{path}:{idx} - reward total {reward.total} outside [0,1]")
+def _may_need_redaction(line: bytes) -> bool:
+    return any(marker in line for marker in _REDACTION_MARKERS)
 
-        if redact_dir:
-            payload_copy = json.loads(json.dumps(payload))
-            redacted = _redact_record(payload_copy)
-            redacted_records.append(json.dumps(redacted, ensure_ascii=False))
 
-    if redact_dir and redacted_records:
-        redact_dir.mkdir(parents=True, exist_ok=True)
-        out_path = redact_dir / path.name
-        out_path.write_text("\n".join(redacted_records) + "\n", encoding="utf-8")
+def _redact_observation(observation: dict) -> Optional[dict]:
+    """Return a copy of ``observation`` without sensitive ids, or None if it has none."""
+    redacted: Optional[dict] = None
+    for section, key in _REDACTED_KEYS.items():
+        block = observation.get(section)
+        if isinstance(block, dict) and key in block:
+            if redacted is None:
+                redacted = dict(observation)
+            stripped = dict(block)  # C-level copy + del, not a per-key Python loop
+            del stripped[key]
+            redacted[section] = stripped
+    return redacted
 
-    return errors
 
+def _redact_record(record: dict) -> Tuple[bool, dict]:
+    """Return ``(changed, record)`` with sensitive ids removed; only the touched dicts are copied."""
+    observation = record.get("observation")
+    redacted_observation = _redact_observation(observation) if isinstance(observation, dict) else None
+    if redacted_observation is None:
+        return False, record
+    redacted = dict(record)
+    redacted["observation"] = redacted_observation
+    return True, redacted
+
+
+class _RedactedWriter:
+    """Stream redacted copies of records to ``out_path``.
+
+    Does nothing without ``out_path``; the file is only created once the first
+    record arrives."""
+
+    def __init__(self, out_path: Optional[Path]) -> None:
+        self._out_path = out_path
+        self._handle: Optional[BinaryIO] = None
+
+    def write(self, line: bytes, payload: Optional[dict] = None) -> None:
+        """Write the redacted form of ``line``; records without sensitive ids pass through as-is.
+
+        ``payload`` is the already-decoded ``line`` when the caller has it."""
+        if self._out_path is None:
+            return
+        if self._handle is None:
+            self._out_path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self._out_path.open("wb")
+        if _may_need_redaction(line):
+            changed, redacted = _redact_record(payload if payload is not None else _loads(line))
+            if changed:
+                # stdlib json keeps wide integers and non-finite floats that orjson cannot write
+                line = json.dumps(redacted, ensure_ascii=False).encode("utf-8")
+        self._handle.write(line)
+        self._handle.write(b"\n")
+
+    def __enter__(self) -> "_RedactedWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._handle is not None:
+            self._handle.close()
+
+
+def _sft_checks(record: SFTRecord) -> List[str]:
+    issues: List[str] = []
+    reward = record.reward
+    weight_sum, weight_delta = _sum_delta(reward.normalized_weights.values(), 1.0)
+    if weight_delta > WEIGHT_SUM_TOLERANCE:
+        issues.append(f"normalized weight sum {weight_sum:.3f} != 1.0")
+    if not (0.0 <= reward.total <= 1.0):
+        issues.append(f"reward total {reward.total} outside [0,1]")
+    return issues
+
+
+def _prefs_checks(record: PreferenceRecord) -> List[str]:
+    issues: List[str] = []
+    candidate_count = len(record.candidates)
+    if record.preference.chosen >= candidate_count:
+        issues.append(f"chosen index {record.preference.chosen} >= candidate count {candidate_count}")
+    if len(record.preference.scores) != candidate_count:
+        issues.append(
+            f"preference scores length {len(record.preference.scores)} != candidate count {candidate_count}"
+        )
+    return issues
+
+
+# Dataset kind -> (JSON Schema path, record-level sanity checks)
+_DATASETS: Dict[str, Tuple[Path, Callable[[Any], List[str]]]] = {
+    "sft": (SFT_SCHEMA_PATH, _sft_checks),
+    "prefs": (PREFS_SCHEMA_PATH, _prefs_checks),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _record_adapter(kind: str) -> TypeAdapter:
+    """Return the record adapter for ``kind``, built once per process.
+
+    Per-line validation then goes straight to the compiled core validator."""
+    from backend.schemas.tutor_rl import PreferenceRecord, SFTRecord
+
+    return TypeAdapter(SFTRecord if kind == "sft" else PreferenceRecord)
+
+
+# (line number, failure label or None, detail); formatted with the path only once reported
+_Issue = Tuple[int, Optional[str], str]
+
+
+def _format_issue(path: Path, issue: _Issue) -> str:
+    idx, label, detail = issue
+    return f"{path}:{idx} - {label}: {detail}" if label else f"{path}:{idx} - {detail}"
+
+
+def _validate_range(
+    kind: str,
+    path: Path,
+    start: int,
+    end: Optional[int],
+    first_line: int,
+    redact_path: Optional[Path],
+    report: Optional[Callable[[_Issue], None]] = None,
+) -> List[_Issue]:
+    """Validate the lines of ``path`` in bytes ``[start, end)`` as ``kind`` records.
+
+    Issues go to ``report`` as they are found when given (the returned list is
+    then empty); worker processes leave it unset and return them instead."""
+    schema_path, extra_checks = _DATASETS[kind]
+    adapter = _record_adapter(kind)
+    validator = _get_validator(schema_path)
+
+    errors: List[_Issue] = []
+    add_issue = report if report is not None else errors.append
+    validate_json = adapter.validate_json
+
+    with _RedactedWriter(redact_path) as redacted_writer:
+        for idx, line in _iter_jsonl_lines(path, start, end, first_line):
+            # Parse and validate in one pydantic-core pass; decode a dict only for the schema check
+            try:
+                record = validate_json(line)
+            except Exception as exc:  # pragma: no cover - error path exercised in QA
+                if _is_json_error(exc):
+                    raise _parse_error(path, idx, exc) from exc
+                add_issue((idx, "pydantic validation failed", str(exc)))
+                continue
+            payload = _loads(line) if validator else None
 
-def validate_prefs(path: Path, *, redact_dir: Optional[Path] = None) -> List[str]:
-    schema_path = ROOT_DIR / "schemas" / "tutor_rl" / "prefs.schema.json"
-    schema = _load_schema(schema_path)
-    validator = None
-    if jsonschema and schema:
-        validator = jsonschema.Draft202012Validator(schema)  # type: ignore
+            if validator:
+                try:
+                    validator(payload)
+                except Exception as exc:  # pragma: no cover - optional
+                    add_issue((idx, "schema validation failed", str(exc)))
 
-    errors: List[str] = []
-    redacted_records: List[str] = []
+            for issue in extra_checks(record):
+                add_issue((idx, None, issue))
 
-    for idx, payload in _load_jsonl(path):
-        try:
-            record = PreferenceRecord.model_validate(payload)
-        except Exception as exc:
-            errors.append(f"{path}:{idx} - pydantic validation failed: {exc}")
-            continue
+            redacted_writer.write(line, payload)
 
-        if validator:
-            try:
-                validator.validate(payload)
-            except Exception as exc:
-                errors.append(f"{path}:{idx} - schema validation failed: {exc}")
-
-        candidate_count = len(record.candidates)
-        if record.preference.chosen >= candidate_count:
-            errors.append(
-                f"{path}:{idx} - chosen index {record.preference.chosen} >= candidate count {candidate_count}"
-            )
-        if len(record.preference.scores) != candidate_count:
-            errors.append(
-                f"{path}:{idx} - preference scores length {len(record.preference.scores)} != candidate count {candidate_count}"
-            )
+    return errors
 
-        if redact_dir:
-            payload_copy = json.loads(json.dumps(payload))
-            redacted = _redact_record(payload_copy)
-            redacted_records.append(json.dumps(redacted, ensure_ascii=False))
 
-    if redact_dir and redacted_records:
-        redact_dir.mkdir(parents=True, exist_ok=True)
-        out_path = redact_dir / path.name
-        out_path.write_text("\n".join(redacted_records) + "\n", encoding="utf-8")
+STAMP_SUFFIX = ".stamp"
 
-    return errors
+
+def _input_stamp(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_size} {stat.st_mtime_ns}"
+
+
+def _redaction_current(path: Path, out_path: Path) -> bool:
+    """True when ``out_path`` was produced from ``path`` as it is now (size and mtime stamp)."""
+    stamp_path = out_path.with_name(out_path.name + STAMP_SUFFIX)
+    try:
+        return (
+            out_path.stat().st_mtime_ns >= path.stat().st_mtime_ns
+            and stamp_path.read_text(encoding="utf-8") == _input_stamp(path)
+        )
+    except OSError:
+        return False
+
+
+def _validate_generic(
+    kind: str,
+    path: Path,
+    redact_dir: Optional[Path],
+    jobs: int,
+    on_error: Optional[Callable[[_Issue], None]],
+) -> List[str]:
+    """Validate ``path`` as ``kind`` records across ``jobs`` processes, redacting unless the stamped copy is current."""
+    out_path = redact_dir / path.name if redact_dir else None
+    if out_path is not None and _redaction_current(path, out_path):
+        redact_dir = out_path = None
+    tmp_path = stamp_path = None
+    if out_path is not None:
+        tmp_path = out_path.with_name(out_path.name + ".tmp")
+        stamp_path = out_path.with_name(out_path.name + STAMP_SUFFIX)
+        stamp_path.unlink(missing_ok=True)
+        tmp_path.unlink(missing_ok=True)
+        # Taken up front so an input rewritten mid-run is redacted again next time
+        stamp = _input_stamp(path)
+
+    issues: List[_Issue] = []
+    try:
+        _validate_ranges(kind, path, redact_dir, tmp_path, jobs, on_error or issues.append)
+    except BaseException:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
+    if tmp_path is not None and tmp_path.exists():
+        tmp_path.replace(out_path)
+        stamp_path.write_text(stamp, encoding="utf-8")
+    return [_format_issue(path, issue) for issue in issues]
+
+
+def _validate_ranges(
+    kind: str,
+    path: Path,
+    redact_dir: Optional[Path],
+    out_path: Optional[Path],
+    jobs: int,
+    report: Callable[[_Issue], None],
+) -> None:
+    ranges = _split_ranges(path, jobs)
+    if len(ranges) == 1:
+        _validate_range(kind, path, 0, None, 1, out_path, report)
+        return
+
+    part_paths = [
+        redact_dir / f"{path.name}.part{n}" if redact_dir else None
+        for n in range(len(ranges))
+    ]
+    for part in part_paths:
+        if part is not None:
+            part.unlink(missing_ok=True)
+    try:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(ranges))) as pool:
+            for range_errors in pool.map(
+                _validate_range,
+                itertools.repeat(kind),
+                itertools.repeat(path),
+                *zip(*ranges),
+                part_paths,
+            ):
+                for issue in range_errors:
+                    report(issue)
+
+        written = [part for part in part_paths if part is not None and part.exists()]
+        if out_path is not None and written:
+            with out_path.open("wb") as out_handle:
+                for part in written:
+                    with part.open("rb") as part_handle:
+                        shutil.copyfileobj(part_handle, out_handle)
+    finally:
+        for part in part_paths:
+            if part is not None:
+                part.unlink(missing_ok=True)
+
+
+def validate_sft(
+    path: Path,
+    *,
+    redact_dir: Optional[Path] = None,
+    jobs: int = 1,
+    on_error: Optional[Callable[[_Issue], None]] = None,
+) -> List[str]:
+    return _validate_generic("sft", path, redact_dir, jobs, on_error)
+
+
+def validate_prefs(
+    path: Path,
+    *,
+    redact_dir: Optional[Path] = None,
+    jobs: int = 1,
+    on_error: Optional[Callable[[_Issue], None]] = None,
+) -> List[str]:
+    return _validate_generic("prefs", path, redact_dir, jobs, on_error)
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -178,38 +470,60 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=None,
         help="Optional directory to write redacted copies of provided datasets",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes per dataset; large files are split into line-aligned byte ranges",
+    )
     return parser.parse_args(argv)
 
 
-def main(argv: Optional[List[str]] = None) -> int:
-    args = parse_args(argv)
-    errors: List[str] = []
+def _append_issue(errors: List[Tuple[Optional[Path], Any]], path: Path, issue: _Issue) -> None:
+    errors.append((path, issue))
 
-    redact_dir = args.redact
-    if redact_dir is not None:
-        redact_dir = redact_dir.resolve()
 
-    if args.sft:
-        if not args.sft.exists():
-            errors.append(f"missing SFT file: {args.sft}")
-        else:
-            errors.extend(validate_sft(args.sft.resolve(), redact_dir=redact_dir))
-
-    if args.prefs:
-        if not args.prefs.exists():
-            errors.append(f"missing preference file: {args.prefs}")
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    # (dataset path, issue) pairs, or (None, message) for problems outside a dataset
+    errors: List[Tuple[Optional[Path], Any]] = []
+
+    redact_dir = args.redact.resolve() if args.redact is not None else None
+    jobs = max(1, args.jobs)
+    written: List[str] = []
+    up_to_date: List[str] = []
+
+    for arg_path, label, validate in (
+        (args.sft, "SFT", validate_sft),
+        (args.prefs, "preference", validate_prefs),
+    ):
+        if not arg_path:
+            continue
+        dataset_path = arg_path.resolve()
+        if not dataset_path.exists():
+            errors.append((None, f"missing {label} file: {arg_path}"))
         else:
-            errors.extend(validate_prefs(args.prefs.resolve(), redact_dir=redact_dir))
+            if redact_dir is not None:
+                current = _redaction_current(dataset_path, redact_dir / dataset_path.name)
+                (up_to_date if current else written).append(dataset_path.name)
+            validate(
+                dataset_path,
+                redact_dir=redact_dir,
+                jobs=jobs,
+                on_error=functools.partial(_append_issue, errors, dataset_path),
+            )
 
     if errors:
-        for err in errors:
-            print(f"ERROR: {err}", file=sys.stderr)
+        for path, err in errors:
+            print(f"ERROR: {err if path is None else _format_issue(path, err)}", file=sys.stderr)
         print(f"Validation finished with {len(errors)} error(s).", file=sys.stderr)
         return 1
 
     print("Validation succeeded: datasets conform to Tutor RL schema.")
-    if redact_dir:
-        print(f"Redacted copies written to {redact_dir}")
+    if written:
+        print(f"Redacted copies written to {redact_dir}: {', '.join(written)}")
+    if up_to_date:
+        print(f"Redacted copies already up to date in {redact_dir}: {', '.join(up_to_date)}")
     return 0
 
 